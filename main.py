@@ -1,15 +1,12 @@
 """
 Main entry point for Lunar Biscuit.
-Runs the API server with self-ticking nodes in the background.
+Runs the API server with self-ticking nodes on the server's event loop.
 """
 
-import asyncio
-import signal
-import sys
-import threading
-from typing import Optional
+import os
 
 import uvicorn
+from fastapi import FastAPI
 
 from radiant_chacha.api.json_rpc import app, set_factory
 from radiant_chacha.core.factory import NeighborFactory
@@ -18,88 +15,77 @@ from radiant_chacha.utils.log_handler import get_logger
 logger = get_logger(__name__, source_file=__file__)
 
 
-class AsyncEventLoopThread:
-    """Runs an asyncio event loop in a background thread."""
-
-    def __init__(self):
-        self.loop: Optional[asyncio.AbstractEventLoop] = None
-        self.thread: Optional[threading.Thread] = None
-        self.running = False
-
-    def start(self) -> asyncio.AbstractEventLoop:
-        """Start the event loop in a background thread and return it."""
-        self.running = True
-        self.thread = threading.Thread(target=self._run_loop, daemon=True)
-        self.thread.start()
-        # Wait for the loop to be created
-        while self.loop is None:
-            pass
-        logger.info("[*] Async event loop started")
-        return self.loop
-
-    def stop(self) -> None:
-        """Stop the event loop."""
-        if self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
-        self.running = False
-        if self.thread:
-            self.thread.join(timeout=5)
-        logger.info("[*] Async event loop stopped")
+def create_app() -> FastAPI:
+    """Create a NeighborFactory, register it with the API and return the app."""
+    factory = NeighborFactory()
+    set_factory(factory)
+    return app
 
-    def _run_loop(self) -> None:
-        """Run the event loop."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        try:
-            self.loop.run_forever()
-        except Exception as e:
-            logger.exception(f"[!!] Event loop error: {e}")
-        finally:
-            self.loop.close()
 
+def run_api_server(
+    host: str = "127.0.0.1",
+    port: int = 8401,
+    workers: int | None = None,
+) -> None:
+    """
+    Run the FastAPI server (blocks until interrupted).
 
-def run_api_server(host: str = "127.0.0.1", port: int = 8401) -> None:
-    """Run the FastAPI server (blocks until interrupted)."""
-    logger.info(f"[*] Starting API server on {host}:{port}")
+    With workers > 1, uvicorn imports create_app() in each worker process, so
+    every worker owns an independent NeighborFactory and simulation. Only use
+    multiple workers when clients do not need a shared view of the nodes.
+    When workers is None, WEB_CONCURRENCY is read at call time (default 1).
+    """
+    if workers is None:
+        workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    logger.info(f"[*] Starting API server on {host}:{port} ({workers} worker(s))")
     logger.info(f"[*] OpenAPI docs available at http://{host}:{port}/docs")
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # "auto" selects uvloop/httptools when installed, else asyncio/h11;
+    # websocket frames are compressed when the client offers permessage-deflate
+    if workers > 1:
+        logger.warning(
+            f"[!] {workers} workers each run an isolated simulation; nodes are not shared"
+        )
+        uvicorn.run(
+            "main:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            log_level="info",
+            loop="auto",
+            http="auto",
+            ws_per_message_deflate=True,
+        )
+        return
+
+    uvicorn.run(
+        create_app(),
+        host=host,
+        port=port,
+        log_level="info",
+        loop="auto",
+        http="auto",
+        ws_per_message_deflate=True,
+    )
 
 
 def main() -> None:
     """
     Main entry point.
     Starts:
-      1. Asyncio event loop (background thread) for node self-ticking
-      2. NeighborFactory with event loop reference
-      3. REST API (FastAPI/Uvicorn, blocking)
+      1. NeighborFactory, registered with the API (one per worker process)
+      2. REST API (FastAPI/Uvicorn, blocking); its lifespan hands the server
+         event loop to the factory so nodes self-tick from its scheduler task
+         and stops it on shutdown
+    Set WEB_CONCURRENCY to run more than one worker process.
     """
     logger.info("[*] Lunar Biscuit starting...")
 
-    # Start asyncio event loop in background thread
-    loop_thread = AsyncEventLoopThread()
-    event_loop = loop_thread.start()
-
-    # Create factory and register it with the event loop
-    factory = NeighborFactory()
-    factory.set_event_loop(event_loop)
-    set_factory(factory)
-
-    # Handle graceful shutdown
-    def signal_handler(sig, frame):
-        logger.info("[*] Shutdown signal received, cleaning up...")
-        loop_thread.stop()
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
-    # Start API server (blocking)
+    # Start API server (blocking); uvicorn handles SIGINT/SIGTERM gracefully
     try:
         run_api_server(host="0.0.0.0", port=8401)
     except KeyboardInterrupt:
         logger.info("[*] API server interrupted")
-        loop_thread.stop()
-        sys.exit(0)
 
 
 if __name__ == "__main__":
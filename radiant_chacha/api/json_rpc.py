@@ -6,13 +6,18 @@ and stream visualization updates.
 
 import asyncio
 import base64
-import json
+import reprlib
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import numpy as np
+import orjson
 from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
@@ -21,18 +26,57 @@ from radiant_chacha.core.factory import NeighborFactory
 from radiant_chacha.interfaces.block import Block
 from radiant_chacha.interfaces.point import Point
 from radiant_chacha.interfaces.sphere import Sphere
+from radiant_chacha.methods.history import ts_to_iso
+from radiant_chacha.methods.movement import neighbor_ids
 from radiant_chacha.utils.log_handler import get_logger
 
 logger = get_logger(__name__, source_file=__file__)
 
+# Global factory instance (managed by main.py)
+_factory: Optional[NeighborFactory] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the node tick scheduler on the server's own event loop."""
+    factory = _factory
+    if factory is not None:
+        factory.set_event_loop(asyncio.get_running_loop())
+    yield
+    await _stop_broadcaster()
+    if factory is not None:
+        await factory.cancel_all_tasks()
+
+
 app = FastAPI(
     title="Lunar Biscuit API",
     description="JSON-RPC style API for node management and simulation control",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Global factory instance (managed by main.py)
-_factory: Optional[NeighborFactory] = None
+# Node listings repeat the same keys per node and compress well; websocket
+# frames are compressed by uvicorn's permessage-deflate instead
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Serialized node cache: node id -> (node state version, node dict)
+_node_dict_cache: dict[int, tuple[int, dict[str, Any]]] = {}
+
+# Websocket frame node cache: node id -> (node state version, frame dict)
+_frame_dict_cache: dict[int, tuple[int, dict[str, Any]]] = {}
+
+# Last encoded websocket frame: ((node id, state version) per node, frame bytes)
+_last_frame: tuple[tuple[tuple[int, int], ...], bytes] | None = None
+
+# Data field cache: node id -> (data object, (summary, type name, serialized))
+_data_cache: dict[int, tuple[Any, tuple[str, str, Any]]] = {}
+
+# Websocket fan-out: one broadcaster task encodes each frame once and pushes
+# it to a small per-client queue (oldest frame dropped for slow clients)
+CLIENT_QUEUE_SIZE = 2
+_clients: set[asyncio.Queue[bytes]] = set()
+_broadcast_task: asyncio.Task | None = None
 
 # Visualizer HTML content (served via /visualizer)
 VISUALIZER_HTML_PATH = (
@@ -44,6 +88,35 @@ VISUALIZER_HTML_PATH = (
 )
 VISUALIZER_STATIC_DIR = VISUALIZER_HTML_PATH.parent
 
+# The page is static, so read it once at import rather than on every request
+try:
+    _VISUALIZER_HTML: bytes | None = VISUALIZER_HTML_PATH.read_bytes()
+except FileNotFoundError:
+    _VISUALIZER_HTML = None
+
+# Max characters in a node data summary
+DATA_SUMMARY_LIMIT = 256
+
+# Bounded repr for container payloads: never stringifies the whole object
+_summary_repr = reprlib.Repr(
+    maxlevel=4,
+    maxdict=64,
+    maxlist=64,
+    maxtuple=64,
+    maxset=64,
+    maxfrozenset=64,
+    maxstring=DATA_SUMMARY_LIMIT,
+    maxother=DATA_SUMMARY_LIMIT,
+)
+
+# Node classes creatable through the API, keyed by node_type
+NODE_TYPES = {"Block": Block, "Point": Point, "Sphere": Sphere}
+
+# orjson encodes ndarrays natively; non-str keys mirror json.dumps behavior
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+# ndarray dtype kinds orjson encodes natively (bool, int, uint, float)
+ORJSON_NUMPY_KINDS = frozenset("biuf")
+
 app.mount(
     "/visualizer_static",
     StaticFiles(directory=VISUALIZER_STATIC_DIR),
@@ -53,11 +126,24 @@ app.mount(
 
 def set_factory(factory: NeighborFactory) -> None:
     """Set the global factory instance."""
-    global _factory
+    global _factory, _last_frame
     _factory = factory
+    _last_frame = None
+    _node_dict_cache.clear()
+    _frame_dict_cache.clear()
+    _data_cache.clear()
+    if _forget_node not in factory.release_hooks:
+        factory.release_hooks.append(_forget_node)
     logger.info("[*] Factory instance registered with API")
 
 
+def _forget_node(node) -> None:
+    """Drop a released node's cached serializations."""
+    _node_dict_cache.pop(node.id, None)
+    _frame_dict_cache.pop(node.id, None)
+    _data_cache.pop(node.id, None)
+
+
 def get_factory() -> NeighborFactory:
     """Get the global factory instance."""
     if _factory is None:
@@ -204,14 +290,14 @@ async def favicon() -> Response:
 
 @app.get("/visualizer", response_class=HTMLResponse)
 async def visualizer_page() -> HTMLResponse:
-    """Serve the Three.js-based visualizer."""
-    if not VISUALIZER_HTML_PATH.exists():
+    """Serve the Three.js-based visualizer (cached at import time)."""
+    if _VISUALIZER_HTML is None:
         raise HTTPException(status_code=404, detail="Visualizer asset missing")
-    return HTMLResponse(VISUALIZER_HTML_PATH.read_text(encoding="utf-8"))
+    return HTMLResponse(_VISUALIZER_HTML)
 
 
 @app.post("/nodes", response_model=NodeResponse)
-async def create_node(req: CreateNodeRequest) -> NodeResponse:
+async def create_node(req: CreateNodeRequest) -> ORJSONResponse:
     """
     Create a new node and add it to the simulation.
 
@@ -226,19 +312,15 @@ async def create_node(req: CreateNodeRequest) -> NodeResponse:
     """
     factory = get_factory()
 
-    node_type_map = {"Block": Block, "Point": Point, "Sphere": Sphere}
-    if req.node_type not in node_type_map:
+    cls = NODE_TYPES.get(req.node_type)
+    if cls is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid node_type '{req.node_type}'. Must be one of: {list(node_type_map.keys())}",
+            detail=f"Invalid node_type '{req.node_type}'. Must be one of: {list(NODE_TYPES.keys())}",
         )
 
-    cls = node_type_map[req.node_type]
-    pos = (
-        _vector_from_list(req.pos, "pos")
-        if req.pos is not None
-        else np.random.rand(3) * 10
-    )
+    # None lets the factory draw a random position from its pre-generated pool
+    pos = _vector_from_list(req.pos, "pos") if req.pos is not None else None
 
     overrides: Dict[str, Any] = {}
     if req.connection_threshold is not None:
@@ -268,55 +350,53 @@ async def create_node(req: CreateNodeRequest) -> NodeResponse:
             **overrides,
         )
         logger.info(
-            f"[*] Created {req.node_type} node {node.id} ({node.addr[:8]}...) at pos {pos}"
+            f"[*] Created {req.node_type} node {node.id} ({node.addr[:8]}...) at pos {node.pos}"
         )
-        return _node_to_response(node)
+        return ORJSONResponse(_node_dict(node))
     except Exception as e:
         logger.exception(f"[!!] Failed to create node: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to create node: {str(e)}")
 
 
 @app.get("/nodes/{node_id}", response_model=NodeResponse)
-async def get_node(node_id: int) -> NodeResponse:
+async def get_node(node_id: int) -> ORJSONResponse:
     """Retrieve a specific node's state by ID."""
-    factory = get_factory()
-
-    for node in factory.nodes:
-        if node.id == node_id:
-            return _node_to_response(node)
-
-    raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
+    node = get_factory().get_by_id(node_id)
+    if node is None:
+        raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
+    return ORJSONResponse(_node_dict(node))
 
 
 @app.get("/nodes/{node_id}/history", response_model=List[HistoryEntryResponse])
-async def get_node_history(node_id: int) -> List[HistoryEntryResponse]:
+async def get_node_history(node_id: int) -> ORJSONResponse:
     """Return serialized history snapshots for a node."""
-    factory = get_factory()
-
-    for node in factory.nodes:
-        if node.id == node_id:
-            history = getattr(node, "history", []) or []
-            return [_history_entry_to_response(entry) for entry in history]
-
-    raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
+    node = get_factory().get_by_id(node_id)
+    if node is None:
+        raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
+    # Copy first: a tick on the worker thread may append while entries are built
+    entries = tuple(node.history)
+    return ORJSONResponse([_history_entry_dict(node, entry) for entry in entries])
 
 
 @app.get("/nodes", response_model=List[NodeResponse])
-async def list_nodes() -> List[NodeResponse]:
+async def list_nodes() -> ORJSONResponse:
     """List all nodes in the simulation."""
     factory = get_factory()
     logger.debug(f"[-] Listing {len(factory.nodes)} nodes")
-    return [_node_to_response(node) for node in factory.nodes]
+    return ORJSONResponse([_node_dict(node) for node in factory.nodes])
 
 
 @app.get("/simulation/status", response_model=SimulationStatusResponse)
-async def get_simulation_status() -> SimulationStatusResponse:
+async def get_simulation_status() -> ORJSONResponse:
     """Get overall simulation status."""
     factory = get_factory()
-    return SimulationStatusResponse(
-        running=True,
-        node_count=len(factory.nodes),
-        nodes=[_node_to_response(node) for node in factory.nodes],
+    nodes = factory.nodes_snapshot
+    return ORJSONResponse(
+        {
+            "running": True,
+            "node_count": len(nodes),
+            "nodes": [_node_dict(node) for node in nodes],
+        }
     )
 
 
@@ -340,14 +420,28 @@ def _summarize_data(value: Any) -> Tuple[str, str]:
     if isinstance(value, bytearray):
         return (f"bytearray len={len(value)}", "bytearray")
 
-    text = str(value)
-    if len(text) > 256:
-        text = text[:253] + "..."
+    if isinstance(value, str):
+        text = value[: DATA_SUMMARY_LIMIT + 1]
+    elif isinstance(value, (dict, list, tuple, set, frozenset)):
+        text = _summary_repr.repr(value)
+    else:
+        text = str(value)
+    if len(text) > DATA_SUMMARY_LIMIT:
+        text = text[: DATA_SUMMARY_LIMIT - 3] + "..."
     return (text, type(value).__name__)
 
 
+def _orjson_native(value: np.ndarray) -> bool:
+    """Whether orjson can encode the array itself (no .tolist() needed)."""
+    return (
+        value.ndim > 0
+        and value.dtype.kind in ORJSON_NUMPY_KINDS
+        and value.flags.c_contiguous
+    )
+
+
 def _serialize_data_payload(value: Any) -> Any:
-    """Produce a JSON-serializable representation of the node data."""
+    """Produce an orjson-serializable representation of the node data."""
     if value is None:
         return None
 
@@ -356,7 +450,7 @@ def _serialize_data_payload(value: Any) -> Any:
             "format": "ndarray",
             "dtype": str(value.dtype),
             "shape": value.shape,
-            "value": value.tolist(),
+            "value": value if _orjson_native(value) else value.tolist(),
         }
 
     if isinstance(value, bytes):
@@ -374,20 +468,23 @@ def _serialize_data_payload(value: Any) -> Any:
             "value": base64.b64encode(raw).decode("ascii"),
         }
 
+    # Validate with the encoder that writes the responses: orjson rejects
+    # values json.dumps accepts, such as integers wider than 64 bits
     try:
-        json.dumps(value)
+        orjson.dumps(value, option=ORJSON_OPTIONS)
         return value
-    except TypeError:
+    except TypeError:  # orjson.JSONEncodeError subclasses TypeError
         return str(value)
 
 
-def _vector_from_list(values: List[float], label: str) -> np.ndarray:
+def _vector_from_list(values: list[float], label: str) -> tuple[float, float, float]:
+    """Validate a 3-vector; the factory copies it straight into its SoA buffers."""
     if len(values) != 3:
         raise HTTPException(
             status_code=400, detail=f"{label} must contain exactly 3 numeric values"
         )
     try:
-        return np.array(values, dtype=np.float64)
+        return (float(values[0]), float(values[1]), float(values[2]))
     except Exception as exc:  # pragma: no cover - defensive guard
         raise HTTPException(status_code=400, detail=f"Invalid {label}: {exc}") from exc
 
@@ -430,57 +527,81 @@ def _interpret_data(payload: Any, fmt: str) -> Any:
     raise HTTPException(status_code=400, detail=f"Unsupported data_format '{fmt}'")
 
 
-def _node_to_response(node) -> NodeResponse:
-    """Convert a NeighborBase node to a NodeResponse."""
+def _data_fields(node) -> tuple[str, str, Any]:
+    """Return (summary, type name, serialized payload), cached per data object."""
+    cached = _data_cache.get(node.id)
+    if cached is not None and cached[0] is node.data:
+        return cached[1]
+
     data_summary, data_type = _summarize_data(node.data)
-    return NodeResponse(
-        id=node.id,
-        type=node.type,
-        addr=node.addr,
-        pos=node.pos.tolist(),
-        velocity=node.velocity.tolist(),
-        gravity=float(node.gravity),
-        neighbors=[nb.id for nb in node.neighbors],
-        data=data_summary,
-        data_serialized=_serialize_data_payload(node.data),
-        attempts=node.attempts,
-        is_anchor=node.is_anchor,
-        data_type=data_type,
-        connection_threshold=float(node.connection_threshold),
-        influence_radius=float(node.influence_radius),
-        stability_window=int(getattr(node, "STABILITY_WINDOW", 0)),
-        tick_interval=float(getattr(node, "tick_interval", 0.0)),
-    )
+    fields = (data_summary, data_type, _serialize_data_payload(node.data))
+    _data_cache[node.id] = (node.data, fields)
+    return fields
 
 
-def _node_packet(node) -> Dict[str, Any]:
-    """Serialize node state for websocket payloads."""
-    data_summary, data_type = _summarize_data(node.data)
-    return {
+def _node_dict(node) -> dict[str, Any]:
+    """Serialize node state for REST responses and websocket payloads.
+
+    This is the single NodeResponse-shaped builder for every endpoint;
+    arrays are left for orjson to encode. Dicts are cached per node and
+    rebuilt only when the node's state version has moved on since the
+    cached copy was built.
+    """
+    # Read the version before building so a concurrent tick forces a rebuild
+    version = node._version
+    cached = _node_dict_cache.get(node.id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data_summary, data_type, data_serialized = _data_fields(node)
+    node_dict = {
         "id": node.id,
         "type": node.type,
         "addr": node.addr,
-        "pos": node.pos.tolist(),
-        "velocity": node.velocity.tolist(),
+        "pos": node.pos,
+        "velocity": node.velocity,
         "gravity": float(node.gravity),
-        "neighbors": [nb.id for nb in node.neighbors],
+        "neighbors": neighbor_ids(node),
         "is_anchor": node.is_anchor,
         "attempts": node.attempts,
         "connection_threshold": float(node.connection_threshold),
         "influence_radius": float(node.influence_radius),
-        "stability_window": int(getattr(node, "STABILITY_WINDOW", 0)),
-        "tick_interval": float(getattr(node, "tick_interval", 0.0)),
+        "stability_window": int(node.STABILITY_WINDOW),
+        "tick_interval": float(node.tick_interval),
         "data": data_summary,
         "data_type": data_type,
-        "data_serialized": _serialize_data_payload(node.data),
+        "data_serialized": data_serialized,
     }
+    _node_dict_cache[node.id] = (version, node_dict)
+    return node_dict
+
+
+def _frame_node_dict(node) -> dict[str, Any]:
+    """Return _node_dict(node) with float32 pos/velocity, for websocket frames.
+
+    The dashboard only draws these vectors, and orjson writes float32 values
+    with about half the digits of float64 ones. Cached per node state
+    version like _node_dict; the float32 vectors are copies, so the version
+    is read before they are taken.
+    """
+    version = node._version
+    cached = _frame_dict_cache.get(node.id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
 
+    frame_dict = dict(_node_dict(node))
+    frame_dict["pos"] = node.pos.astype(np.float32)
+    frame_dict["velocity"] = node.velocity.astype(np.float32)
+    _frame_dict_cache[node.id] = (version, frame_dict)
+    return frame_dict
 
-def _vector_like_to_list(value: Any) -> List[float]:
+
+def _vector_like(value: Any) -> Any:
+    """Return a vector as an orjson-encodable array or list of floats."""
     if value is None:
         return []
     if isinstance(value, np.ndarray):
-        return value.tolist()
+        return value if _orjson_native(value) else value.tolist()
     if isinstance(value, (list, tuple)):
         return [float(v) for v in value]
     try:
@@ -489,30 +610,90 @@ def _vector_like_to_list(value: Any) -> List[float]:
         return []
 
 
-def _history_entry_to_response(entry: Dict[str, Any]) -> HistoryEntryResponse:
-    data_summary, data_type = _summarize_data(entry.get("data"))
-    neighbors_raw = entry.get("neighbors", []) or []
-    neighbors = [
-        HistoryNeighbor(
-            id=int(nb.get("id", -1)),
-            addr=str(nb.get("addr", "")),
-            type=nb.get("type"),
-        )
-        for nb in neighbors_raw
-        if nb is not None
-    ]
-    return HistoryEntryResponse(
-        idx=int(entry.get("idx", 0)),
-        timestamp=str(entry.get("timestamp", "")),
-        addr=str(entry.get("addr", "")),
-        pos=_vector_like_to_list(entry.get("pos")),
-        velocity=_vector_like_to_list(entry.get("velocity")),
-        gravity=float(entry.get("gravity", 0.0)),
-        type=entry.get("type"),
-        neighbors=neighbors,
-        data_summary=data_summary,
-        data_type=data_type,
-    )
+def _history_entry_dict(node, entry: dict[str, Any]) -> dict[str, Any]:
+    """Serialize a history snapshot into a HistoryEntryResponse-shaped dict.
+
+    Neighbor summaries are already plain dicts when snapshot() records
+    them, so they are passed through as-is.
+    """
+    data = entry.get("data")
+    if data is node.data:
+        data_summary, data_type, _ = _data_fields(node)
+    else:
+        data_summary, data_type = _summarize_data(data)
+    return {
+        "idx": int(entry.get("idx", 0)),
+        "timestamp": ts_to_iso(entry["timestamp"]) if "timestamp" in entry else "",
+        "addr": str(entry.get("addr", "")),
+        "pos": _vector_like(entry.get("pos")),
+        "velocity": _vector_like(entry.get("velocity")),
+        "gravity": float(entry.get("gravity", 0.0)),
+        "type": entry.get("type"),
+        "neighbors": entry.get("neighbors") or [],
+        "data_summary": data_summary,
+        "data_type": data_type,
+    }
+
+
+def _encode_frame() -> bytes:
+    """Encode one websocket frame with the current state of every node.
+
+    While no node has been added, removed or changed since the last frame,
+    that frame's bytes are returned again (timestamp included) instead of
+    re-encoding identical state.
+    """
+    global _last_frame
+    # One snapshot read keeps node_count and nodes consistent with each other
+    nodes = get_factory().nodes_snapshot
+    signature = tuple((node.id, node._version) for node in nodes)
+    if _last_frame is not None and _last_frame[0] == signature:
+        return _last_frame[1]
+
+    payload = {
+        "node_count": len(nodes),
+        "timestamp": time.monotonic(),
+        "nodes": [_frame_node_dict(node) for node in nodes],
+    }
+    frame = orjson.dumps(payload, option=ORJSON_OPTIONS)
+    _last_frame = (signature, frame)
+    return frame
+
+
+async def _broadcaster() -> None:
+    """Encode a frame every STREAM_UPDATE_INTERVAL and queue it for each client."""
+    while True:
+        if _clients:
+            try:
+                frame = _encode_frame()
+            except Exception:  # pragma: no cover - telemetry/logging focus
+                logger.exception("[!!] Websocket frame encoding error")
+            else:
+                for queue in list(_clients):
+                    if queue.full():
+                        queue.get_nowait()  # drop the stale frame
+                    queue.put_nowait(frame)
+        await asyncio.sleep(STREAM_UPDATE_INTERVAL)
+
+
+def _ensure_broadcaster() -> None:
+    """Start the broadcaster on the running loop if it is not already running."""
+    global _broadcast_task
+    loop = asyncio.get_running_loop()
+    if (
+        _broadcast_task is None
+        or _broadcast_task.done()
+        or _broadcast_task.get_loop() is not loop
+    ):
+        _broadcast_task = loop.create_task(_broadcaster())
+
+
+async def _stop_broadcaster() -> None:
+    """Cancel the broadcaster task, if any."""
+    global _broadcast_task
+    task, _broadcast_task = _broadcast_task, None
+    if task is not None and task.get_loop() is asyncio.get_running_loop():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
 
 
 @app.websocket("/ws/nodes")
@@ -520,18 +701,16 @@ async def websocket_nodes(websocket: WebSocket) -> None:
     """Push live node snapshots to connected visualizers."""
     await websocket.accept()
     logger.info("[*] Visualizer websocket client connected")
+    queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    _clients.add(queue)
+    _ensure_broadcaster()
     try:
         while True:
-            factory = get_factory()
-            payload = {
-                "node_count": len(factory.nodes),
-                "timestamp": asyncio.get_event_loop().time(),
-                "nodes": [_node_packet(node) for node in factory.nodes],
-            }
-            await websocket.send_json(payload)
-            await asyncio.sleep(STREAM_UPDATE_INTERVAL)
+            await websocket.send_bytes(await queue.get())
     except WebSocketDisconnect:
         logger.info("[-] Visualizer websocket client disconnected")
     except Exception as exc:  # pragma: no cover - telemetry/logging focus
         logger.exception(f"[!!] Websocket streaming error: {exc}")
         await websocket.close(code=1011)
+    finally:
+        _clients.discard(queue)
@@ -35,5 +35,17 @@ BLOCK_TICK_INTERVAL = 10.0
 POINT_TICK_INTERVAL = 2.0
 SPHERE_TICK_INTERVAL = 30.0
 
+# Hash used for node addresses: "sha256" (64 hex chars) or "xxh3" (32 hex chars,
+# XXH3-128, much faster but not cryptographic; needs the optional xxhash package)
+ADDRESS_HASH = "sha256"
+
+# Run scheduled node ticks on one worker thread instead of the event loop, so
+# API and websocket handlers are not held up by discovery. Ticks stay serialized
+# with each other and with node creation/release.
+TICK_IN_WORKER_THREAD = False
+
+# Max history snapshots kept per node; the oldest are dropped first
+HISTORY_MAX_LENGTH = 1000
+
 # Web dashboard streaming interval (seconds between websocket pushes)
 STREAM_UPDATE_INTERVAL = 0.25
@@ -1,13 +1,31 @@
 import asyncio
-import hashlib
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Optional, Set, Type, Union
+import heapq
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, fields
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
 
 import numpy as np
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # optional "spatial" extra; nodes_within falls back to a scan
+    cKDTree = None
+
+from radiant_chacha.config import TICK_IN_WORKER_THREAD
 from radiant_chacha.interfaces.block import Block
 from radiant_chacha.interfaces.point import Point
 from radiant_chacha.interfaces.sphere import Sphere
+from radiant_chacha.methods.address import addr_hexdigest
+from radiant_chacha.methods.discovery import discover_and_negotiate
+from radiant_chacha.methods.history import record_history
+from radiant_chacha.methods.movement import neighbors_changed, remove_neighbor
+from radiant_chacha.methods.physics import apply_gravity_many
+from radiant_chacha.methods.similarity import unit_data_matrix
+from radiant_chacha.methods.tick import tick
 from radiant_chacha.utils.log_handler import get_logger
 
 if TYPE_CHECKING:
@@ -19,89 +37,444 @@ _factory_token = object()
 
 NeighborType = Union[Type[Block], Type[Point], Type[Sphere]]
 
+# Initial row capacity of the shared position/velocity buffers (grown geometrically)
+_INITIAL_CAPACITY = 64
+
+# Node array buffers that _recycle keeps instead of resetting to None; their
+# fill counters are reset, so the old contents are never read
+_RECYCLED_BUFFERS = frozenset({"_hist_vectors", "_pos_window"})
+
+# Number of random default positions generated per refill of the pool
+_RANDOM_POOL_SIZE = 4096
+
+
+def _batch_addr_hash(inputs: Sequence[bytes]) -> list[str]:
+    """Return the address hex digest of each input, in order.
+
+    The inputs are short birth strings, below the size at which hashlib
+    releases the GIL, so they are hashed in one tight loop rather than
+    fanned out to threads.
+    """
+    return [addr_hexdigest(data) for data in inputs]
+
 
 class NeighborFactory:
     """Neighbor Factory for creating NeighborBase objects.
     Ensures unique IDs and addresses for each created object.
-    Each node spawns its own async task to self-tick.
+    Nodes self-tick on their own intervals, driven by a single scheduler
+    task on the factory's event loop.
 
     :param _counter: Internal counter for unique IDs
     :type _counter: int
     :param nodes: List of all created NeighborBase objects
     :type nodes: list[NeighborBase]
-    :param _tasks: Set of running asyncio tasks for node ticking
-    :type _tasks: Set[asyncio.Task]
-    :param _event_loop: Optional asyncio event loop for spawning tasks
+    :param _by_id: Index of created NeighborBase objects by ID
+    :type _by_id: dict[int, NeighborBase]
+    :param _snapshot: Immutable copy of nodes, or None until nodes_snapshot rebuilds it
+    :type _snapshot: Optional[tuple[NeighborBase, ...]]
+    :param _schedule: Min-heap of (due time, node ID, node) tick entries
+    :type _schedule: list[tuple[float, int, NeighborBase]]
+    :param _scheduler_task: Task running the tick scheduler, once started
+    :type _scheduler_task: Optional[asyncio.Task]
+    :param _wakeup: Set when a node is scheduled, to wake a sleeping scheduler
+    :type _wakeup: Optional[asyncio.Event]
+    :param _event_loop: Optional asyncio event loop for the tick scheduler
     :type _event_loop: Optional[asyncio.AbstractEventLoop]
+    :param _tick_executor: Worker thread running scheduled ticks when
+        TICK_IN_WORKER_THREAD is set, else None
+    :type _tick_executor: Optional[ThreadPoolExecutor]
+    :param _step_lock: Held by each scheduled tick and by node creation/release
+    :type _step_lock: threading.RLock
+    :param pos_buf: Contiguous (capacity, 3) array; each node's pos is a row view
+    :type pos_buf: np.ndarray
+    :param vel_buf: Contiguous (capacity, 3) array; each node's velocity is a row view
+    :type vel_buf: np.ndarray
+    :param max_influence_radius: Largest influence_radius of any created node
+    :type max_influence_radius: float
+    :param _pool: Released nodes kept for reuse by create_many, per class
+    :type _pool: dict[type, list[NeighborBase]]
+    :param _spatial_index: k-d tree over node positions and the nodes it indexes,
+        set only while tick_all() runs discovery
+    :type _spatial_index: Optional[tuple[cKDTree, tuple[NeighborBase, ...]]]
+    :param _data_matrix: Unit data vectors and norms by buffer row, set only while
+        tick_all() runs discovery over nodes that all carry vector data
+    :type _data_matrix: Optional[tuple[np.ndarray, np.ndarray]]
+    :param release_hooks: Called with each node after release() removes it,
+        so caches keyed by node ID can drop it
+    :type release_hooks: list[Callable[[NeighborBase], None]]
     """
 
     def __init__(self):
         self._counter = 0
         self.nodes: list["NeighborBase"] = []
-        self._tasks: Set[asyncio.Task] = set()
+        self._by_id: dict[int, NeighborBase] = {}
+        self._snapshot: tuple[NeighborBase, ...] | None = ()
+        self._nodes_lock = threading.Lock()
+        self._rand_pool: np.ndarray = np.random.rand(_RANDOM_POOL_SIZE, 3) * 10
+        self._rand_idx = 0
+        self.max_influence_radius: float = 0.0
+        self._pool: dict[type, list[NeighborBase]] = {}
+        self.release_hooks: list[Callable[[NeighborBase], None]] = []
+        self._spatial_index: tuple[Any, tuple[NeighborBase, ...]] | None = None
+        self._data_matrix: tuple[np.ndarray, np.ndarray] | None = None
+        self._schedule: list[tuple[float, int, NeighborBase]] = []
+        self._scheduler_task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tick_executor: ThreadPoolExecutor | None = None
+        self._step_lock = threading.RLock()
+        self.pos_buf: np.ndarray = np.zeros((_INITIAL_CAPACITY, 3), dtype=np.float64)
+        self.vel_buf: np.ndarray = np.zeros((_INITIAL_CAPACITY, 3), dtype=np.float64)
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
-        """Set the event loop for spawning node tasks."""
+        """Set the event loop that runs the node tick scheduler."""
         self._event_loop = loop
+        self._wakeup = asyncio.Event()
+        if TICK_IN_WORKER_THREAD and self._tick_executor is None:
+            # One worker keeps ticks in order; the GIL allows no more anyway
+            self._tick_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="node-tick"
+            )
         logger.info("[*] Factory event loop set for node self-ticking")
 
+    def _schedule_tick(self, obj: "NeighborBase") -> None:
+        """Queue a node's first tick now and make sure the scheduler is running."""
+        loop = self._event_loop
+        heapq.heappush(self._schedule, (loop.time(), obj.id, obj))
+        self._wakeup.set()
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = loop.create_task(self._run_scheduler())
+            logger.debug("[-] Started node tick scheduler")
+
+    async def _run_scheduler(self) -> None:
+        """Tick every due node, then sleep until the next one is due.
+
+        Each node is re-queued tick_interval seconds after its tick, as a
+        per-node sleep loop would. Released nodes are dropped when their
+        entry comes up. With a tick executor, the loop awaits each tick
+        instead of running it.
+        """
+        loop = asyncio.get_running_loop()
+        schedule = self._schedule
+        wakeup = self._wakeup
+        executor = self._tick_executor
+        while True:
+            delay = schedule[0][0] - loop.time() if schedule else None
+            if delay is None or delay > 0:
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            _, node_id, obj = heapq.heappop(schedule)
+            if self._by_id.get(node_id) is not obj:
+                continue
+            if executor is None:
+                self._tick_node(obj)
+                # Let API and websocket handlers run between node ticks
+                await asyncio.sleep(0)
+            else:
+                await loop.run_in_executor(executor, self._tick_node, obj)
+            heapq.heappush(schedule, (loop.time() + obj.tick_interval, node_id, obj))
+
+    def _tick_node(self, obj: "NeighborBase") -> None:
+        """Run one scheduled tick of obj, logging rather than raising failures."""
+        try:
+            with self._step_lock:
+                # A worker-thread tick may start after obj was released
+                if self._by_id.get(obj.id) is obj:
+                    tick(obj=obj, dt=obj.tick_interval)
+        except Exception:
+            logger.exception(f"[!!] Tick failed for node {obj.id}")
+
+    def tick_all(self, dt: float = 1.0) -> None:
+        """Step every live node once, without the scheduler.
+
+        Each node records history and negotiates neighbors as in tick(),
+        then all nodes move together in one batched gravity pass over the
+        position buffer. Use it to drive a simulation synchronously; do not
+        mix it with a running scheduler.
+
+        :param dt: Time step applied to every node
+        :type dt: float
+        """
+        nodes = self.nodes_snapshot
+        # Positions hold still until the gravity pass, so one k-d tree built
+        # here answers every discovery query of the step
+        if cKDTree is not None and nodes:
+            self._spatial_index = (cKDTree(self.pos_buf[: len(nodes)]), nodes)
+        # Data is not reassigned during discovery either, so every node's
+        # unit vector is stacked once and candidates are scored by gathering rows
+        self._data_matrix = unit_data_matrix(nodes)
+        try:
+            for obj in nodes:
+                record_history(obj=obj)
+                discover_and_negotiate(obj=obj)
+        finally:
+            self._spatial_index = None
+            self._data_matrix = None
+
+        apply_gravity_many(nodes, dt=dt)
+
+        # Invalidate cached serializations of every node
+        for obj in nodes:
+            obj._version += 1
+
     def _next_id(self) -> int:
         self._counter += 1
         return self._counter
 
-    def _generate_addr(self, birth: str) -> str:
-        return hashlib.sha256(birth.encode("utf-8")).hexdigest()
+    def _reserve_rows(self, count: int = 1) -> int:
+        """Return the first of count free buffer rows, doubling capacity until they fit.
+
+        Growing reallocates the buffers, so existing nodes are re-pointed
+        at their rows in the new arrays.
+        """
+        row = len(self.nodes)
+        if row + count <= self.pos_buf.shape[0]:
+            return row
+
+        capacity = self.pos_buf.shape[0] * 2
+        while capacity < row + count:
+            capacity *= 2
+        pos_buf = np.zeros((capacity, 3), dtype=np.float64)
+        vel_buf = np.zeros((capacity, 3), dtype=np.float64)
+        pos_buf[:row] = self.pos_buf[:row]
+        vel_buf[:row] = self.vel_buf[:row]
+        self.pos_buf, self.vel_buf = pos_buf, vel_buf
+        for i, node in enumerate(self.nodes):
+            node.pos = pos_buf[i]
+            node.velocity = vel_buf[i]
+        logger.debug(f"[-] Grew node buffers to capacity {capacity}")
+        return row
+
+    def _random_position(self) -> np.ndarray:
+        """Return the next pre-generated random position in [0, 10)^3."""
+        if self._rand_idx >= _RANDOM_POOL_SIZE:
+            self._rand_pool = np.random.rand(_RANDOM_POOL_SIZE, 3) * 10
+            self._rand_idx = 0
+        position = self._rand_pool[self._rand_idx]
+        self._rand_idx += 1
+        return position
+
+    @property
+    def nodes_snapshot(self) -> tuple["NeighborBase", ...]:
+        """Immutable copy of nodes, safe to iterate while nodes are added.
+
+        Creating or releasing nodes only invalidates the copy; it is rebuilt
+        on the next read, so a run of create() calls does not copy the node
+        list once per node.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._nodes_lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self.nodes)
+        return snapshot
+
+    def get_by_id(self, node_id: int) -> Optional["NeighborBase"]:
+        """Return the node with the given ID, or None if it does not exist."""
+        return self._by_id.get(node_id)
+
+    def nodes_within(self, center: np.ndarray, radius: float) -> list["NeighborBase"]:
+        """Return nodes whose position lies within radius of center, in node order.
+
+        Distances are computed in one vectorized pass over the position buffer,
+        or looked up in the k-d tree tick_all() builds when scipy is installed.
+        """
+        index = self._spatial_index
+        if index is not None:
+            tree, nodes = index
+            hits = tree.query_ball_point(center, radius)
+            hits.sort()
+            return [nodes[i] for i in hits]
+
+        nodes = self.nodes_snapshot
+        offsets = self.pos_buf[: len(nodes)] - center
+        dist_sq = np.einsum("ij,ij->i", offsets, offsets)
+        return [nodes[i] for i in np.flatnonzero(dist_sq <= radius * radius)]
+
+    def positions(self) -> np.ndarray:
+        """Return an (N, 3) view of every node position, in node order."""
+        return self.pos_buf[: len(self.nodes)]
+
+    def velocities(self) -> np.ndarray:
+        """Return an (N, 3) view of every node velocity, in node order."""
+        return self.vel_buf[: len(self.nodes)]
 
     def create(
         self,
         cls: NeighborType,
         *,
         data: Optional[Any] = None,
-        pos: Optional[np.ndarray] = None,
+        pos: np.ndarray | Sequence[float] | None = None,
         **overrides: Any,
     ) -> Block | Point | Sphere:
+        return self.create_many(cls, [dict(overrides, data=data, pos=pos)])[0]
+
+    def create_many(
+        self, cls: NeighborType, specs: Sequence[dict[str, Any]]
+    ) -> list[Block | Point | Sphere]:
+        """Create one node of cls per spec, in order.
+
+        Each spec holds the keyword arguments accepted by create(). IDs,
+        birth timestamps and addresses are produced for the whole batch up
+        front, and the node list is published once at the end.
+        """
         if not issubclass(cls, (Block, Point, Sphere)):
             raise TypeError(
                 f"Factory can only create Block, Point, Sphere subclasses, not {cls}"
             )
 
-        obj_id = self._next_id()
-        birth = datetime.now(timezone.utc).isoformat()
-        addr = self._generate_addr(birth)
-        position = pos if pos is not None else np.random.rand(3) * 10
-
-        # Construct the object with the internal token and all needed args
-        init_kwargs = {
-            "id": obj_id,
-            "data": data,
-            "factory": self,
-            "pos": position,
-            "addr": addr,
-            "_token": _factory_token,  # enforce factory-only construction
-        }
-        init_kwargs.update(overrides)
-
-        obj: Block | Point | Sphere = cls(**init_kwargs)
-        self.nodes.append(obj)
-        logger.info(
-            f"[*] Created {cls.__name__} node {obj_id} ({addr[:8]}...) at pos {position}"
-        )
-
-        # Spawn async task for this node to self-tick
-        if self._event_loop:
-            task = self._event_loop.create_task(obj.run())
-            self._tasks.add(task)
-            task.add_done_callback(lambda t: self._tasks.discard(t))
-            logger.debug(f"[-] Node {obj_id} spawned self-tick task")
+        # Held while nodes and buffers change, so a tick never sees it half done
+        with self._step_lock:
+            # Births are keyed by ID as well as timestamp, since tight creation
+            # loops can read the same clock value twice
+            ids = [self._next_id() for _ in specs]
+            births = [f"{time.time_ns()}:{obj_id}".encode() for obj_id in ids]
+            addrs = _batch_addr_hash(births)
+
+            # Node pos/velocity are row views into the shared SoA buffers
+            first_row = self._reserve_rows(len(specs))
+            created: list[Block | Point | Sphere] = []
+            for row, obj_id, addr, spec in zip(
+                range(first_row, first_row + len(specs)), ids, addrs, specs
+            ):
+                overrides = dict(spec)
+                data = overrides.pop("data", None)
+                pos = overrides.pop("pos", None)
+                self.pos_buf[row] = pos if pos is not None else self._random_position()
+                self.vel_buf[row] = overrides.pop("velocity", 0.0)
+
+                # Construct the object with the internal token and all needed args
+                init_kwargs = {
+                    "id": obj_id,
+                    "data": data,
+                    "factory": self,
+                    "pos": self.pos_buf[row],
+                    "velocity": self.vel_buf[row],
+                    "addr": addr,
+                    "_row": row,
+                    "_token": _factory_token,  # enforce factory-only construction
+                }
+                init_kwargs.update(overrides)
+                pool = self._pool.get(cls)
+                obj = (
+                    self._recycle(pool.pop(), init_kwargs)
+                    if pool
+                    else cls(**init_kwargs)
+                )
+                created.append(obj)
 
+            with self._nodes_lock:
+                self.nodes.extend(created)
+                for obj in created:
+                    self._by_id[obj.id] = obj
+                    self.max_influence_radius = max(
+                        self.max_influence_radius, float(obj.influence_radius)
+                    )
+                self._snapshot = None
+
+        # Formatting each position costs more than building the node, so skip
+        # it outright when INFO is disabled
+        log_created = logger.isEnabledFor(logging.INFO)
+        for obj in created:
+            if log_created:
+                logger.info(
+                    f"[*] Created {cls.__name__} node {obj.id} ({obj.addr[:8]}...) at pos {obj.pos}"
+                )
+
+            # Hand the node to the tick scheduler
+            if self._event_loop:
+                self._schedule_tick(obj)
+                logger.debug(f"[-] Node {obj.id} scheduled to self-tick")
+
+        return created
+
+    @staticmethod
+    def _recycle(
+        obj: "NeighborBase", init_kwargs: dict[str, Any]
+    ) -> Block | Point | Sphere:
+        """Re-initialize a released node in place, as cls(**init_kwargs) would.
+
+        Fields not in init_kwargs go back to their declared defaults; the
+        neighbors list and history deque are cleared rather than reallocated,
+        and the history and stability buffers are kept for the new node's
+        snapshots to overwrite.
+        """
+        for f in fields(obj):
+            if f.name in init_kwargs:
+                setattr(obj, f.name, init_kwargs[f.name])
+            elif f.name in _RECYCLED_BUFFERS:
+                continue
+            elif f.default is not MISSING:
+                setattr(obj, f.name, f.default)
+        if "neighbors" not in init_kwargs:
+            obj.neighbors.clear()
+            obj._neighbor_id_set.clear()
+        if "history" not in init_kwargs:
+            obj.history.clear()
+        obj.__post_init__()
         return obj
 
+    def release(self, obj: "NeighborBase") -> None:
+        """Remove a node from the simulation and keep it for reuse.
+
+        The node is unlinked from its neighbors and the scheduler stops
+        ticking it. The last node takes over the freed buffer row, so node
+        order is not preserved across a release.
+
+        :raises KeyError: If obj is not a live node of this factory
+        """
+        with self._step_lock:
+            with self._nodes_lock:
+                if self._by_id.get(obj.id) is not obj:
+                    raise KeyError(f"Node {obj.id} is not live in this factory")
+                row = self.nodes.index(obj)
+                last = self.nodes.pop()
+                # Detach the released node from the buffers before its row is reused
+                obj.pos = obj.pos.copy()
+                obj.velocity = obj.velocity.copy()
+                if last is not obj:
+                    self.pos_buf[row] = last.pos
+                    self.vel_buf[row] = last.velocity
+                    last.pos = self.pos_buf[row]
+                    last.velocity = self.vel_buf[row]
+                    last._row = row
+                    # Cached serializations still hold views of the old row
+                    last._version += 1
+                    self.nodes[row] = last
+                obj._row = -1
+                del self._by_id[obj.id]
+                self._snapshot = None
+
+            # Links are normally mutual, but check every node in case one is not;
+            # neighbors of the moved last node drop their cached buffer rows
+            for nb in self.nodes_snapshot:
+                remove_neighbor(nb, obj)
+                if last.id in nb._neighbor_id_set:
+                    nb._neighbor_rows = None
+            obj.neighbors.clear()
+            obj._neighbor_id_set.clear()
+            neighbors_changed(obj)
+
+            self._pool.setdefault(type(obj), []).append(obj)
+        for hook in self.release_hooks:
+            hook(obj)
+        logger.info(f"[*] Released {type(obj).__name__} node {obj.id}")
+
     async def cancel_all_tasks(self) -> None:
-        """Cancel all node ticking tasks."""
+        """Stop the node tick scheduler and drop all pending ticks."""
         logger.info("[*] Cancelling all node tasks...")
-        for task in list(self._tasks):
+        task, self._scheduler_task = self._scheduler_task, None
+        if task is not None:
             task.cancel()
-        # Wait for all tasks to finish cancellation
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+            # Wait for the scheduler to finish cancellation
+            await asyncio.gather(task, return_exceptions=True)
+        self._schedule.clear()
+        executor, self._tick_executor = self._tick_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import sys
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
+from radiant_chacha.config import HISTORY_MAX_LENGTH
 from radiant_chacha.core.protocol import NeighborProtocol, Vec3
+from radiant_chacha.methods.physics import desired_neighbors
 from radiant_chacha.methods.tick import tick
 
 if TYPE_CHECKING:
     from radiant_chacha.core import NeighborFactory
 
 
-@dataclass
+@dataclass(slots=True)
 class NeighborBase(NeighborProtocol, ABC):
     """
     NeighborBase: Base class for all neighbor types (Block, Point, Sphere)
@@ -28,7 +33,7 @@ class NeighborBase(NeighborProtocol, ABC):
     :type data: Any
     :param factory: Reference to the NeighborFactory that created this node
     :type factory: NeighborFactory
-    :param addr: SHA-256 address string
+    :param addr: Address hex digest (SHA-256 unless config.ADDRESS_HASH says otherwise)
     :type addr: str
     :param attempts: Integer count of connection attempts that have exceeded degree limit
     :type attempts: int
@@ -36,22 +41,60 @@ class NeighborBase(NeighborProtocol, ABC):
     :type connection_threshold: float
     :param influence_radius: Float [0,1]|inf(experimental) for influence calculations
     :type influence_radius: float
+    :param max_degree: Maximum number of neighbors
+    :type max_degree: int | float
     :param pos: 3D position vector (numpy ndarray)
     :type pos: Vec3
     :param velocity: 3D velocity vector (numpy ndarray)
     :type velocity: Vec3
     :param gravity: Scalar gravity value
     :type gravity: float
-    :param neighbors: List of connected NeighborProtocol instances
+    :param neighbors: Connected NeighborProtocol instances, ordered by ID
     :type neighbors: list[NeighborProtocol]
     :param is_anchor: Boolean indicating if node is an anchor
     :type is_anchor: bool
-    :param history: List of state snapshots for history tracking
-    :type history: list[dict[str, Any]]
+    :param history: Most recent state snapshots (at most HISTORY_MAX_LENGTH)
+    :type history: deque[dict[str, Any]]
     :param STABILITY_WINDOW: Max history length for stability calculations
     :type STABILITY_WINDOW: int
     :param tick_interval: Float seconds between ticks
     :type tick_interval: float
+    :param type: Class name of the node, set in __post_init__
+    :type type: str
+    :param _version: Counter bumped whenever the node's state is mutated
+    :type _version: int
+    :param _state_version: Counter bumped when state recorded in history changes
+    :type _state_version: int
+    :param _snapshot_version: _state_version at the latest history snapshot
+    :type _snapshot_version: int
+    :param _neighbor_ids: Cached IDs of neighbors, reset to None when neighbors change
+    :type _neighbor_ids: Optional[list[int]]
+    :param _neighbor_rows: Cached factory buffer rows of neighbors, or None
+    :type _neighbor_rows: Optional[np.ndarray]
+    :param _neighbor_id_set: IDs of neighbors, for O(1) membership checks
+    :type _neighbor_id_set: set[int]
+    :param _degree_limit: Cached degree_limit(), sys.maxsize if unlimited
+    :type _degree_limit: int
+    :param _desired_neighbors: Cached desired_neighbors() for compute_gravity
+    :type _desired_neighbors: float
+    :param _addr_bytes: addr encoded to bytes; set in __post_init__ and by update_addr
+    :type _addr_bytes: bytes
+    :param _data_bytes: (data object, str(data).encode()) cached by update_addr
+    :type _data_bytes: Optional[tuple[Any, bytes]]
+    :param _data_vec: (data object, data as unit float array, its norm) cached by similarity
+    :type _data_vec: Optional[tuple[Any, np.ndarray, float]]
+    :param _pair_scores: Cached str/bytes similarity to other nodes, by their id
+    :type _pair_scores: Optional[dict[int, tuple[Any, Any, float]]]
+    :param _row: Row of this node in the factory's position/velocity buffers
+    :type _row: int
+    :param _pos_window: Most recent snapshot positions, oldest first (see record_position)
+    :type _pos_window: Optional[np.ndarray]
+    :param _pos_window_len: Number of filled rows in _pos_window
+    :type _pos_window_len: int
+    :param _stability: Cached stability(), reset to None when a position is recorded
+    :type _stability: Optional[float]
+    :param _hist_vectors: (rows, 2, 3) pos/velocity storage viewed by history entries
+    :type _hist_vectors: Optional[np.ndarray]
     """
 
     id: int
@@ -59,26 +102,37 @@ class NeighborBase(NeighborProtocol, ABC):
     factory: "NeighborFactory"
 
     # --- Identity Hash ---
-    addr: str = ""  # SHA-256 string (set at init)
+    addr: str = ""  # hex digest, see config.ADDRESS_HASH (set at init)
 
     # --- Attempt Counter ---
     attempts: int = 0
 
+    # --- Per-type parameters: Block/Point/Sphere default these from config ---
+
     # --- Connection Threshold (should be a float from 0-1, lower is more permissive) ---
-    connection_threshold: float = field(default_factory=float)
+    connection_threshold: float = 0.0
 
     # --- Influence Radius (geometric reach for proximity decay in similarity/should_connect).
     # Higher values = nodes stay connected over greater spatial distances.
     # Used in should_connect() to normalize distance: proximity = 1 - (dist / (radius * 2))
     # ---
-    influence_radius: float = field(default_factory=float)
+    influence_radius: float = 0.0
+
+    # Max number of neighbors; float('inf') means unlimited
+    max_degree: int | float = float("inf")
+
+    # Max number of positions to reference when calculating stability
+    STABILITY_WINDOW: int = 10
+
+    # Floating point number of seconds between ticks
+    tick_interval: float = 1.0
 
     # --- Spatial Position ---
     pos: Vec3 = field(default_factory=lambda: np.zeros(3, dtype=float))
 
     # --- Physics ---
     velocity: Vec3 = field(default_factory=lambda: np.zeros(3, dtype=np.float64))
-    gravity: float = np.float64(0.0)
+    gravity: float = 0.0
 
     # --- Neighbors list ---
     neighbors: list["NeighborProtocol"] = field(default_factory=list)
@@ -87,13 +141,57 @@ class NeighborBase(NeighborProtocol, ABC):
     is_anchor: bool = False
 
     # --- Snapshots of states after changes ---
-    history: list[dict[str, Any]] = field(default_factory=list[dict[str, Any]])
+    history: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=HISTORY_MAX_LENGTH)
+    )
 
-    # Max number of positions to reference when calculating stability
-    STABILITY_WINDOW: int = 10
+    # Node type name (set in __post_init__)
+    type: str = field(default="", init=False, repr=False)
 
-    # Floating point number of seconds between ticks
-    tick_interval: float = 1.0
+    # State version, bumped on every mutation so serializers can cache by it
+    _version: int = 0
+
+    # Bumped by move/apply_gravity/neighbors_changed; lets record_history skip idle nodes
+    _state_version: int = field(default=0, repr=False)
+    _snapshot_version: int = field(default=-1, repr=False)
+
+    # Neighbor ID list cache (see methods.movement.neighbor_ids)
+    _neighbor_ids: list[int] | None = field(default=None, repr=False)
+
+    # Neighbor buffer row cache (see methods.movement.neighbor_rows)
+    _neighbor_rows: np.ndarray | None = field(default=None, repr=False)
+
+    # Neighbor ID set, kept in step with neighbors by add_neighbor
+    _neighbor_id_set: set[int] = field(default_factory=set, repr=False)
+
+    # degree_limit() cached for the neighbor-negotiation hot path
+    _degree_limit: int = field(default=sys.maxsize, repr=False)
+    _desired_neighbors: float = field(default=10.0, repr=False)
+
+    # Encoded addr, read by neighbors' address updates (see methods.address)
+    _addr_bytes: bytes = field(default=b"", repr=False)
+
+    # Encoded data for address updates, keyed by data identity (see methods.address)
+    _data_bytes: tuple[Any, bytes] | None = field(default=None, repr=False)
+
+    # Float copy and norm of array data, keyed by data identity (see methods.similarity)
+    _data_vec: tuple[Any, np.ndarray, float] | None = field(default=None, repr=False)
+
+    # str/bytes similarity to other nodes, by other.id (see methods.similarity)
+    _pair_scores: dict[int, tuple[Any, Any, float]] | None = field(
+        default=None, repr=False
+    )
+
+    # Buffer row assigned by NeighborFactory (pos/velocity are views of it)
+    _row: int = field(default=-1, repr=False)
+
+    # Stability window of recent snapshot positions (see methods.movement.stability)
+    _pos_window: np.ndarray | None = field(default=None, repr=False)
+    _pos_window_len: int = field(default=0, repr=False)
+    _stability: float | None = field(default=None, repr=False)
+
+    # Position/velocity rows behind history entries (see methods.history.snapshot)
+    _hist_vectors: np.ndarray | None = field(default=None, repr=False)
 
     # Token initialized as None to enforce factory construction
     _token: Optional[object] = None
@@ -115,8 +213,26 @@ class NeighborBase(NeighborProtocol, ABC):
         """Maximum allowable neighbors. float('inf') means unlimited."""
         ...
 
+    def refresh_degree_limit(self) -> None:
+        """Re-read degree_limit() into the cache used by neighbor checks.
+
+        Call after changing max_degree (or anything degree_limit() depends on)
+        on a live node. An unlimited degree is cached as sys.maxsize so that
+        neighbor checks always compare two ints. The desired neighbor count
+        used by compute_gravity depends only on the limit and type, so it
+        is cached here too.
+        """
+        limit = self.degree_limit()
+        self._degree_limit = sys.maxsize if limit == math.inf else int(limit)
+        self._desired_neighbors = desired_neighbors(self.type, self._degree_limit)
+
     def __post_init__(self) -> None:
-        self.type: str = self.__class__.__name__
+        self.type = self.__class__.__name__
+        self._addr_bytes = self.addr.encode()
+        self.refresh_degree_limit()
+        # History must stay bounded: snapshot() slots its vectors by maxlen
+        if not isinstance(self.history, deque) or self.history.maxlen is None:
+            self.history = deque(self.history, maxlen=HISTORY_MAX_LENGTH)
         if getattr(self, "_token", None) is None:
             raise RuntimeError(
                 "Use NeighborFactory to create instances, do not instantiate directly."
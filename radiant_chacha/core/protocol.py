@@ -35,6 +35,9 @@ class NeighborProtocol(Protocol):
     :type tick_interval: float
     """
 
+    # Lets slotted implementations (NeighborBase) avoid a per-instance __dict__
+    __slots__ = ()
+
     id: int
     data: Any
     addr: str  # identity hash and lineage tracing
@@ -1,4 +1,3 @@
-import asyncio
 from dataclasses import dataclass
 
 from radiant_chacha.config import (
@@ -10,7 +9,7 @@ from radiant_chacha.config import (
 from radiant_chacha.core.neighbor_base import NeighborBase
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(NeighborBase):
     """
     A Block has:
@@ -41,27 +40,13 @@ class Block(NeighborBase):
         factory.create(Block, data={...}, connection_threshold=0.5)  # override threshold
     """
 
-    influence_radius: float = float(8)
-    connection_threshold: float = 0.4
+    # Per-type defaults from config
+    influence_radius: float = BLOCK_INFLUENCE_RADIUS
+    connection_threshold: float = BLOCK_CONNECTION_THRESHOLD
     max_degree: int = 6
+    STABILITY_WINDOW: int = BLOCK_STABILITY_WINDOW
+    tick_interval: float = BLOCK_TICK_INTERVAL
     is_anchor: bool = False
 
     def degree_limit(self) -> int:
         return self.max_degree
-
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        # Apply config defaults if not overridden
-        if self.connection_threshold == 0.4:  # default value, not explicitly set
-            self.connection_threshold = BLOCK_CONNECTION_THRESHOLD
-        if self.influence_radius == 8.0:
-            self.influence_radius = BLOCK_INFLUENCE_RADIUS
-        self.STABILITY_WINDOW = BLOCK_STABILITY_WINDOW
-        self.tick_interval = BLOCK_TICK_INTERVAL
-        # Start the run loop as an asyncio task
-        try:
-            asyncio.get_running_loop()
-            asyncio.create_task(self.run())
-        except RuntimeError:
-            # No event loop running, create one if needed
-            pass
@@ -1,4 +1,3 @@
-import asyncio
 from dataclasses import dataclass
 
 from radiant_chacha.config import (
@@ -10,7 +9,7 @@ from radiant_chacha.config import (
 from radiant_chacha.core.neighbor_base import NeighborBase
 
 
-@dataclass
+@dataclass(slots=True)
 class Point(NeighborBase):
     """
     A Point:
@@ -41,27 +40,13 @@ class Point(NeighborBase):
         factory.create(Point, data={...}, connection_threshold=0.7)  # override threshold
     """
 
-    influence_radius: float = float(3)
-    connection_threshold: float = 0.8
+    # Per-type defaults from config
+    influence_radius: float = POINT_INFLUENCE_RADIUS
+    connection_threshold: float = POINT_CONNECTION_THRESHOLD
     max_degree: int = 1
+    STABILITY_WINDOW: int = POINT_STABILITY_WINDOW
+    tick_interval: float = POINT_TICK_INTERVAL
     is_anchor: bool = False
 
     def degree_limit(self) -> int:
         return self.max_degree
-
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        # Apply config defaults if not overridden
-        if self.connection_threshold == 0.8:
-            self.connection_threshold = POINT_CONNECTION_THRESHOLD
-        if self.influence_radius == 3.0:
-            self.influence_radius = POINT_INFLUENCE_RADIUS
-        self.STABILITY_WINDOW = POINT_STABILITY_WINDOW
-        self.tick_interval = POINT_TICK_INTERVAL
-        # Start the run loop as an asyncio task
-        try:
-            asyncio.get_running_loop()
-            asyncio.create_task(self.run())
-        except RuntimeError:
-            # No event loop running, create one if needed
-            pass
@@ -1,4 +1,3 @@
-import asyncio
 from dataclasses import dataclass
 
 from radiant_chacha.config import (
@@ -10,7 +9,7 @@ from radiant_chacha.config import (
 from radiant_chacha.core.neighbor_base import NeighborBase
 
 
-@dataclass
+@dataclass(slots=True)
 class Sphere(NeighborBase):
     """
     A Sphere:
@@ -42,27 +41,13 @@ class Sphere(NeighborBase):
         factory.create(Sphere, data={...}, is_anchor=False)  # movable hub
     """
 
-    influence_radius: float = float(15)
-    connection_threshold: float = 0.2
+    # Per-type defaults from config
+    influence_radius: float = SPHERE_INFLUENCE_RADIUS
+    connection_threshold: float = SPHERE_CONNECTION_THRESHOLD
     max_degree: float = float("inf")  # unlimited
+    STABILITY_WINDOW: int = SPHERE_STABILITY_WINDOW
+    tick_interval: float = SPHERE_TICK_INTERVAL
     is_anchor: bool = True  # does not move by default
 
     def degree_limit(self) -> float:
         return self.max_degree
-
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        # Apply config defaults if not overridden
-        if self.connection_threshold == 0.2:
-            self.connection_threshold = SPHERE_CONNECTION_THRESHOLD
-        if self.influence_radius == 15.0:
-            self.influence_radius = SPHERE_INFLUENCE_RADIUS
-        self.STABILITY_WINDOW = SPHERE_STABILITY_WINDOW
-        self.tick_interval = SPHERE_TICK_INTERVAL
-        # Start the run loop as an asyncio task
-        try:
-            asyncio.get_running_loop()
-            asyncio.create_task(self.run())
-        except RuntimeError:
-            # No event loop running, create one if needed
-            pass
@@ -1,16 +1,25 @@
 from .address import update_addr
-from .history import record_history, snapshot
+from .history import record_history, snapshot, ts_to_iso
 from .movement import (
     add_neighbor,
     can_accept_more_neighbors,
     competition,
     distance_to,
+    distances_to_many,
     move,
+    neighbor_ids,
+    neighbor_rows,
+    neighbors_changed,
+    record_position,
+    remove_neighbor,
+    sorted_neighbors,
     stability,
 )
 from .physics import (
     apply_gravity,
+    apply_gravity_many,
     compute_gravity,
+    desired_neighbors,
     local_gravity_vector,
 )
 
@@ -18,13 +27,23 @@ __all__ = [
     "update_addr",
     "record_history",
     "snapshot",
+    "ts_to_iso",
     "distance_to",
+    "distances_to_many",
     "can_accept_more_neighbors",
     "add_neighbor",
+    "remove_neighbor",
     "move",
+    "neighbor_ids",
+    "neighbor_rows",
+    "neighbors_changed",
+    "record_position",
+    "sorted_neighbors",
     "stability",
     "competition",
     "compute_gravity",
+    "desired_neighbors",
     "local_gravity_vector",
     "apply_gravity",
+    "apply_gravity_many",
 ]
@@ -3,25 +3,65 @@
 # ------------------------------------------------------------------
 
 import hashlib
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+try:
+    import xxhash
+except ImportError:  # optional "xxhash" extra; ADDRESS_HASH="xxh3" falls back to sha256
+    xxhash = None
+
+from radiant_chacha.config import ADDRESS_HASH
+from radiant_chacha.methods.movement import sorted_neighbors
+from radiant_chacha.utils.log_handler import get_logger
+
 if TYPE_CHECKING:
     from radiant_chacha.core.neighbor_base import NeighborBase
 
+logger = get_logger(__name__, source_file=__file__)
+
+
+def _sha256_hexdigest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _select_addr_hash() -> Callable[[bytes], str]:
+    """Return the digest function named by config.ADDRESS_HASH."""
+    if ADDRESS_HASH == "xxh3":
+        if xxhash is not None:
+            return xxhash.xxh3_128_hexdigest
+        logger.warning(
+            "ADDRESS_HASH is 'xxh3' but xxhash is not installed; using sha256"
+        )
+    elif ADDRESS_HASH != "sha256":
+        raise ValueError(f"Unknown ADDRESS_HASH {ADDRESS_HASH!r}")
+    return _sha256_hexdigest
+
+
+# Hex digest of bytes, used for every node address (birth and updates)
+addr_hexdigest: Callable[[bytes], str] = _select_addr_hash()
+
 
 def update_addr(obj: "NeighborBase") -> None:
     """
-    Compute SHA-256 hash representing this node's state.
+    Compute the hash (config.ADDRESS_HASH) representing this node's state.
+
+    The inputs are joined and hashed in one call, which yields the same
+    digest as feeding them to successive update() calls. The encoded data
+    is cached per data object, so it is only re-encoded after obj.data is
+    reassigned; mutating data in place does not refresh it. Addresses are
+    read from each node's _addr_bytes, which is kept in step with addr.
     """
-    h = hashlib.sha256()
-    h.update(str(obj.addr).encode())
-    h.update(str(obj.data).encode())
-    h.update(obj.pos.tobytes())
+    cached = obj._data_bytes
+    if cached is None or cached[0] is not obj.data:
+        cached = obj._data_bytes = (obj.data, str(obj.data).encode())
+
+    parts = [obj._addr_bytes, cached[1], obj.pos.tobytes()]
 
     # Incorporate neighbor hashes to maintain lineage
     if obj.neighbors:
-        for nb in sorted(obj.neighbors, key=lambda n: n.id):
-            if isinstance(nb.addr, str):
-                h.update(nb.addr.encode())
+        parts.extend([nb._addr_bytes for nb in sorted_neighbors(obj)])
 
-    obj.addr = h.hexdigest()
+    addr = addr_hexdigest(b"".join(parts))
+    obj.addr = addr
+    obj._addr_bytes = addr.encode()
@@ -1,7 +1,20 @@
+import logging
+import math
+from collections.abc import Sequence
+from itertools import repeat
 from typing import TYPE_CHECKING
 
-from radiant_chacha.methods import add_neighbor, can_accept_more_neighbors
-from radiant_chacha.methods.similarity import should_connect
+import numpy as np
+
+from radiant_chacha.methods import (
+    add_neighbor,
+    distances_to_many,
+)
+from radiant_chacha.methods.similarity import (
+    max_connect_distance,
+    should_connect,
+    should_connect_many,
+)
 from radiant_chacha.utils.log_handler import get_logger
 
 if TYPE_CHECKING:
@@ -13,50 +26,113 @@ logger = get_logger(__name__, source_file=__file__)
 def discover_and_negotiate(obj: "NeighborBase") -> None:
     """Obtain candidate list heuristically from the node or its factory"""
     # --- Neighbor discovery / negotiation (basic) ---
-    candidates = []
+    # f-strings are built before the logger checks its level, so the loop
+    # only formats messages when they will be emitted
+    debug = logger.isEnabledFor(logging.DEBUG)
+    info = logger.isEnabledFor(logging.INFO)
+
+    candidates: Sequence[NeighborBase] = ()
+    # True when reach is finite, i.e. distance alone can rule candidates out
+    gate_by_distance = False
     factory = obj.factory
-    if factory is not None and hasattr(factory, "nodes"):
-        try:
-            candidates = list(factory.nodes)
+    if factory is not None and hasattr(factory, "nodes_snapshot"):
+        # Only nodes within reach of the threshold can pass should_connect;
+        # when data similarity alone can pass, every node is a candidate
+        reach = max_connect_distance(
+            obj=obj,
+            max_other_radius=factory.max_influence_radius,
+            threshold=obj.connection_threshold,
+        )
+        gate_by_distance = math.isfinite(reach)
+        if gate_by_distance:
+            candidates = factory.nodes_within(obj.pos, reach)
+        else:
+            # Immutable snapshot: safe to iterate while other threads create nodes
+            candidates = factory.nodes_snapshot
+        if debug:
             logger.debug(f"Discovered {len(candidates)} candidates from factory")
-        except Exception:
-            candidates = []
+
+    # Inlined can_accept_more_neighbors(); the cached limit holds for the pass.
+    # Attributes read per candidate are bound to locals once.
+    neighbors = obj.neighbors
+    neighbor_id_set = obj._neighbor_id_set
+    limit = obj._degree_limit
+    threshold = obj.connection_threshold
+
+    # Distances to every candidate in one pass; a full node stops at the first
+    # new candidate, so it does not need them
+    dists = scores = None
+    if candidates and len(neighbors) < limit:
+        dist_arr = distances_to_many(obj, candidates)
+        dists = dist_arr.tolist()
+        # Array and numeric data are scored for every candidate at once; other
+        # data is scored lazily, since a node that fills up early skips the rest
+        if isinstance(obj.data, (np.ndarray, int, float)):
+            scores = should_connect_many(
+                obj, candidates, threshold=threshold, dists=dist_arr
+            )[1].tolist()
 
     # run a simple one-pass discovery (stop early if this node is full)
-    for cand in candidates:
+    for cand, dist, score in zip(
+        candidates,
+        repeat(math.inf) if dists is None else dists,
+        repeat(None) if scores is None else scores,
+    ):
         if cand is obj:
-            logger.debug(f"{obj.type}: {obj.addr} skipping self")
+            if debug:
+                logger.debug(f"{obj.type}: {obj.addr} skipping self")
             continue
-        if cand in obj.neighbors:
-            logger.debug(
-                f"{obj.type}: {obj.addr} skipping existing neighbor: {cand.type}: {cand.addr}"
-            )
+        if cand.id in neighbor_id_set:
+            if debug:
+                logger.debug(
+                    f"{obj.type}: {obj.addr} skipping existing neighbor: {cand.type}: {cand.addr}"
+                )
             continue
         # stop if this node can't accept more neighbors
-        if not can_accept_more_neighbors(obj=obj):
-            logger.info(f"{obj.type}: {obj.addr} full, stop discovery")
-            logger.debug(
-                f"{obj.type}: {obj.addr} neighbors: {[n.addr[:8] for n in obj.neighbors]}"
-            )
-            logger.debug(f"{obj.type}: {obj.addr} total attempt count: {obj.attempts}")
+        if len(neighbors) >= limit:
+            if info:
+                logger.info(f"{obj.type}: {obj.addr} full, stop discovery")
+            if debug:
+                logger.debug(
+                    f"{obj.type}: {obj.addr} neighbors: {[n.addr[:8] for n in obj.neighbors]}"
+                )
+                logger.debug(
+                    f"{obj.type}: {obj.addr} total attempt count: {obj.attempts}"
+                )
             break
 
-        ok, score = should_connect(
-            obj=obj, other=cand, threshold=obj.connection_threshold
-        )
-        if not ok:
-            logger.debug(
-                f"{obj.type}: {obj.addr} rejected candidate: {cand.type}: {cand.addr} with score {score:.3f}"
-            )
-            logger.debug(
-                f"threshold={obj.connection_threshold}, score={score:.3f}, ok={ok}"
+        # reach assumed the largest radius in the swarm; the bound for this
+        # pair is tighter and rules the candidate out before data similarity
+        if gate_by_distance and dist > max_connect_distance(
+            obj=obj,
+            max_other_radius=cand.influence_radius,
+            threshold=threshold,
+        ):
+            if debug:
+                logger.debug(
+                    f"{obj.type}: {obj.addr} out of reach of candidate: {cand.type}: {cand.addr}"
+                )
+            continue
+
+        if score is None:
+            ok, score = should_connect(
+                obj=obj, other=cand, threshold=threshold, dist=dist
             )
+        else:
+            ok = score >= threshold
+        if not ok:
+            if debug:
+                logger.debug(
+                    f"{obj.type}: {obj.addr} rejected candidate: {cand.type}: {cand.addr} with score {score:.3f}"
+                )
+                logger.debug(f"threshold={threshold}, score={score:.3f}, ok={ok}")
             continue
 
         # add neighbor, allow attempts to increment if needed
-        logger.info(
-            f"Attempting to connect {obj.type}: {obj.addr} to candidate: {cand.type}: {cand.addr} with score {score:.3f}"
-        )
+        if info:
+            logger.info(
+                f"Attempting to connect {obj.type}: {obj.addr} to candidate: {cand.type}: {cand.addr} with score {score:.3f}"
+            )
         add_neighbor(obj=obj, other=cand)
         add_neighbor(obj=cand, other=obj)
         # record negotiation result in history
@@ -2,11 +2,16 @@
 # History Snapshot
 # ------------------------------------------------------------------
 
-from datetime import datetime, timezone
+import logging
+import time
+from datetime import UTC, datetime
 from pprint import pformat
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from radiant_chacha.methods.address import update_addr
+from radiant_chacha.methods.movement import record_position
 from radiant_chacha.utils.log_handler import get_logger
 
 if TYPE_CHECKING:
@@ -14,65 +19,150 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__, source_file=__file__)
 
+# Rows allocated for a node's first history vectors (see _history_vectors)
+_HISTORY_INITIAL_ROWS = 8
+
+
+def ts_to_iso(ts: int) -> str:
+    """Convert a snapshot timestamp (ns since the epoch) to an ISO 8601 UTC string."""
+    seconds, ns = divmod(ts, 1_000_000_000)
+    dt = datetime.fromtimestamp(seconds, UTC)
+    return dt.replace(microsecond=ns // 1000).isoformat()
+
+
+def _history_vectors(obj: "NeighborBase", idx: int) -> np.ndarray:
+    """Return the (2, 3) row of obj._hist_vectors for history entry idx.
+
+    Row 0 holds the position and row 1 the velocity. The buffer starts
+    small and doubles up to history.maxlen, after which entries wrap; a row
+    is only reused once the deque has dropped the entry that pointed at it.
+    Entries taken before a resize keep viewing the old buffer, which is
+    never written again. snapshot() drops the oldest entry before reusing its row.
+    """
+    buf = obj._hist_vectors
+    cap = obj.history.maxlen
+    slot = idx % cap
+    if buf is None or slot >= buf.shape[0]:
+        size = max(_HISTORY_INITIAL_ROWS, 2 * (0 if buf is None else buf.shape[0]))
+        while size <= slot:
+            size *= 2
+        size = min(size, cap)
+        grown = np.empty((size, 2, 3), dtype=np.float64)
+        if buf is not None:
+            grown[: buf.shape[0]] = buf
+        buf = obj._hist_vectors = grown
+    return buf[slot]
+
+
+def _neighbors_match(obj: "NeighborBase", summaries: list[dict]) -> bool:
+    """Return True if summaries describe obj's current neighbors, in order."""
+    return len(obj.neighbors) == len(summaries) and all(
+        nb.id == summary["id"]
+        and nb.addr == summary["addr"]
+        and nb.type == summary["type"]
+        for nb, summary in zip(obj.neighbors, summaries)
+    )
+
 
 def snapshot(obj: "NeighborBase") -> None:
-    """Save full state snapshot into history dict."""
-    ts = datetime.now(timezone.utc).isoformat()
+    """Save full state snapshot into history dict.
+
+    The timestamp is stored as integer nanoseconds (time.time_ns()); use
+    ts_to_iso() where a readable string is needed. pos and velocity are
+    read-only views into the node's history buffer (see _history_vectors).
+    The neighbor summary list is shared with the previous entry when the
+    neighbors have not changed, so entries must not be mutated.
+    """
+    ts = time.time_ns()
+
+    last_neighbors = obj.history[-1]["neighbors"] if obj.history else None
+    if last_neighbors is not None and _neighbors_match(obj, last_neighbors):
+        neighbor_summary = last_neighbors
+    else:
+        neighbor_summary = [
+            {"id": nb.id, "type": nb.type, "addr": nb.addr} for nb in obj.neighbors
+        ]
 
-    neighbor_summary = [
-        {"id": nb.id, "type": nb.type, "addr": nb.addr} for nb in obj.neighbors
-    ]
+    # initial snapshot is index 0; idx keeps counting after old entries are dropped
+    idx = obj.history[-1]["idx"] + 1 if obj.history else 0
+    if len(obj.history) == obj.history.maxlen:
+        # Drop the oldest entry before its history vectors are overwritten
+        obj.history.popleft()
+    vectors = _history_vectors(obj, idx)
+    vectors[0] = obj.pos
+    vectors[1] = obj.velocity
+    pos_snap, velocity_snap = vectors
+    pos_snap.flags.writeable = False
+    velocity_snap.flags.writeable = False
 
     obj.history.append(
         {
-            "idx": len(obj.history),  # initial snapshot is index 0
+            "idx": idx,
             "timestamp": ts,
             "addr": obj.addr,
             "neighbors": neighbor_summary,
-            "pos": obj.pos.copy(),
+            "pos": pos_snap,
             "data": obj.data,
             "gravity": obj.gravity,
             "type": obj.type,
-            "velocity": obj.velocity.copy(),
+            "velocity": velocity_snap,
         }
     )
-    logger.debug(f"Snapshot saved for {obj.addr}: {pformat(obj.history[-1], width=80)}")
+    obj._snapshot_version = obj._state_version
+    record_position(obj)
+    # Pretty-printing the entry costs far more than taking it
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Snapshot saved for {obj.addr}: {pformat(obj.history[-1], width=80)}"
+        )
 
 
-def record_history(obj: "NeighborBase") -> None:
-    """Record a new history snapshot if state has changed."""
-    if len(obj.history) == 0:
-        snapshot(obj)  # initial snapshot
+def _has_changed(obj: "NeighborBase") -> bool:
+    """Return True if the node differs from its latest history snapshot.
 
-    def _has_changed() -> bool:
-        # compare neighbor summaries (not object lists) to avoid recursion
-        current_neighbors = [
-            {"id": nb.id, "type": nb.type, "addr": nb.addr} for nb in obj.neighbors
-        ]
-        last_neighbors = obj.history[-1].get("neighbors", [])
+    Checks run cheapest first: scalars, then vectors by their raw bytes,
+    then the neighbor summary entry by entry.
+    """
+    last = obj.history[-1]
+
+    if obj.gravity != last["gravity"]:
+        logger.debug(f"Gravity changed for {obj.addr}")
+        return True
+
+    if obj.type != last["type"]:
+        logger.debug(f"Type changed for {obj.addr}")
+        return True
+
+    if obj.pos.tobytes() != last["pos"].tobytes():
+        logger.debug(f"Position changed for {obj.addr}")
+        return True
 
-        if current_neighbors != last_neighbors:
-            logger.debug(f"Neighbors changed for {obj.addr}")
-            return True
+    if obj.velocity.tobytes() != last["velocity"].tobytes():
+        logger.debug(f"Velocity changed for {obj.addr}")
+        return True
 
-        if (obj.pos != obj.history[-1]["pos"]).all():
-            logger.debug(f"Position changed for {obj.addr}")
-            return True
+    # compare neighbor summaries (not object lists) to avoid recursion
+    if not _neighbors_match(obj, last.get("neighbors", [])):
+        logger.debug(f"Neighbors changed for {obj.addr}")
+        return True
 
-        if obj.gravity != obj.history[-1]["gravity"]:
-            logger.debug(f"Gravity changed for {obj.addr}")
-            return True
+    return False
 
-        if obj.type != obj.history[-1]["type"]:
-            logger.debug(f"Type changed for {obj.addr}")
-            return True
 
-        if (obj.velocity != obj.history[-1]["velocity"]).all():
-            logger.debug(f"Velocity changed for {obj.addr}")
-            return True
+def record_history(obj: "NeighborBase") -> None:
+    """Record a new history snapshot if state has changed."""
+    if len(obj.history) == 0:
+        snapshot(obj)  # initial snapshot
 
-        return False
+    # The node's own state is unchanged since the last snapshot, so only
+    # neighbor addresses can differ from it
+    if obj._state_version == obj._snapshot_version:
+        last_neighbors = obj.history[-1]["neighbors"]
+        if all(
+            nb.addr == last["addr"] for nb, last in zip(obj.neighbors, last_neighbors)
+        ):
+            return
 
-    if _has_changed():
+    if _has_changed(obj):
         update_addr(obj=obj)
         snapshot(obj=obj)
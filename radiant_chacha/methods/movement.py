@@ -1,3 +1,7 @@
+import math
+from bisect import insort
+from collections.abc import Sequence
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -5,6 +9,8 @@ import numpy as np
 if TYPE_CHECKING:
     from radiant_chacha.core.neighbor_base import NeighborBase, Vec3
 
+_node_id = attrgetter("id")
+
 
 def distance_to(obj: "NeighborBase", other: "NeighborBase") -> float:
     """
@@ -20,29 +26,61 @@ def distance_to(obj: "NeighborBase", other: "NeighborBase") -> float:
     float
         Euclidean distance between obj.pos and other.pos. Raises or propagates errors
         if positions are not valid numeric arrays.
+
+    Notes
+    -----
+    Positions are 3-vectors, so the distance is computed on Python floats;
+    numpy's per-call dispatch would cost several times the arithmetic.
+    """
+    return math.dist(obj.pos.tolist(), other.pos.tolist())
+
+
+def distances_to_many(
+    obj: "NeighborBase", others: Sequence["NeighborBase"]
+) -> np.ndarray:
     """
-    return float(np.linalg.norm(obj.pos - other.pos))
+    Compute the Euclidean distance from one node to each of many nodes.
+
+    Parameters
+    ----------
+    obj : NeighborBase
+        Reference node.
+    others : Sequence[NeighborBase]
+        Live nodes of the same factory as obj.
+
+    Returns
+    -------
+    numpy.ndarray
+        Float array of len(others) distances, in the order of others.
+
+    Notes
+    -----
+    Positions are gathered from the factory's position buffer by row, so all
+    distances come from one vectorized pass rather than one call per node.
+    """
+    rows = [other._row for other in others]
+    offsets = obj.factory.pos_buf[rows] - obj.pos
+    return np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
 
 
 def can_accept_more_neighbors(obj: "NeighborBase") -> bool:
     """
     Check whether a node can accept additional neighbors.
 
-    This consults the node's degree_limit() method and compares it to the current
-    neighbor list length.
+    This consults the node's cached degree_limit() value and compares it to the
+    current neighbor list length.
 
     Parameters
     ----------
     obj : NeighborBase
-        Node exposing neighbors (list-like) and degree_limit().
+        Node exposing neighbors (list-like) and a cached _degree_limit.
 
     Returns
     -------
     bool
-        True if len(obj.neighbors) < obj.degree_limit(), False otherwise.
+        True if len(obj.neighbors) < obj._degree_limit, False otherwise.
     """
-    lim = obj.degree_limit()
-    return len(obj.neighbors) < lim
+    return len(obj.neighbors) < obj._degree_limit
 
 
 def add_neighbor(obj: "NeighborBase", other: "NeighborBase") -> bool:
@@ -55,7 +93,8 @@ def add_neighbor(obj: "NeighborBase", other: "NeighborBase") -> bool:
       - rejects if the receiver has reached its degree_limit()
       - adds to attempts counter if degree limit is reached
 
-    If the checks pass, `other` is appended to obj.neighbors.
+    If the checks pass, `other` is inserted into obj.neighbors, which is kept
+    ordered by ID.
 
     Parameters
     ----------
@@ -69,26 +108,141 @@ def add_neighbor(obj: "NeighborBase", other: "NeighborBase") -> bool:
     bool
         True if neighbor was added, False if not (for any reason).
     """
-    if other is obj:
+    if other is obj or other.id in obj._neighbor_id_set:
         return False
 
-    if other in obj.neighbors:
+    # Inlined can_accept_more_neighbors(); this runs for every candidate pair
+    if len(obj.neighbors) >= obj._degree_limit:
+        obj.attempts += 1
+        obj._version += 1
         return False
 
-    if not can_accept_more_neighbors(obj=obj):
-        obj.attempts += 1
+    # IDs mostly arrive in ascending order, so this is usually an append
+    insort(obj.neighbors, other, key=_node_id)
+    obj._neighbor_id_set.add(other.id)
+    neighbors_changed(obj)
+    return True
+
+
+def remove_neighbor(obj: "NeighborBase", other: "NeighborBase") -> bool:
+    """
+    Remove `other` from `obj`'s neighbor list, if present.
+
+    Membership is checked against obj._neighbor_id_set, so nodes that are not
+    neighbors cost one set lookup.
+
+    Parameters
+    ----------
+    obj : NeighborBase
+        Node whose neighbor list is changed.
+    other : NeighborBase
+        Neighbor to drop.
+
+    Returns
+    -------
+    bool
+        True if other was a neighbor and has been removed, False otherwise.
+    """
+    if other.id not in obj._neighbor_id_set:
         return False
 
-    obj.neighbors.append(other)
+    obj.neighbors.remove(other)
+    obj._neighbor_id_set.discard(other.id)
+    neighbors_changed(obj)
     return True
 
 
+def neighbors_changed(obj: "NeighborBase") -> None:
+    """
+    Drop a node's cached neighbor views after its neighbor list changed.
+
+    Parameters
+    ----------
+    obj : NeighborBase
+        Node whose neighbors were added or removed.
+    """
+    obj._neighbor_ids = None
+    obj._neighbor_rows = None
+    obj._version += 1
+    obj._state_version += 1
+
+
+def neighbor_ids(obj: "NeighborBase") -> list[int]:
+    """
+    Return the IDs of a node's neighbors, in neighbor order.
+
+    The list is cached on the node and rebuilt only after the neighbor set
+    changes (see neighbors_changed). Callers must treat it as read-only.
+
+    Parameters
+    ----------
+    obj : NeighborBase
+        Node exposing neighbors (list-like).
+
+    Returns
+    -------
+    list[int]
+        Neighbor IDs.
+    """
+    ids = obj._neighbor_ids
+    if ids is None:
+        ids = obj._neighbor_ids = [nb.id for nb in obj.neighbors]
+    return ids
+
+
+def neighbor_rows(obj: "NeighborBase") -> np.ndarray:
+    """
+    Return the factory buffer rows of a node's neighbors, in neighbor order.
+
+    The index array is cached on the node and rebuilt only after the
+    neighbor set changes or a neighbor moves to another row (see
+    NeighborFactory.release). Callers must treat it as read-only.
+
+    Parameters
+    ----------
+    obj : NeighborBase
+        Node exposing neighbors (list-like).
+
+    Returns
+    -------
+    numpy.ndarray
+        Neighbor rows as an intp array.
+    """
+    rows = obj._neighbor_rows
+    if rows is None:
+        rows = obj._neighbor_rows = np.fromiter(
+            (nb._row for nb in obj.neighbors), dtype=np.intp, count=len(obj.neighbors)
+        )
+    return rows
+
+
+def sorted_neighbors(obj: "NeighborBase") -> list["NeighborBase"]:
+    """
+    Return a node's neighbors ordered by ID.
+
+    add_neighbor() keeps obj.neighbors in ID order, so this is the neighbor
+    list itself and costs no sort. Callers must treat it as read-only.
+
+    Parameters
+    ----------
+    obj : NeighborBase
+        Node exposing neighbors (list-like).
+
+    Returns
+    -------
+    list[NeighborBase]
+        Neighbors sorted by ascending ID.
+    """
+    return obj.neighbors
+
+
 def move(obj: "NeighborBase", delta: "Vec3", dt: float = 1.0) -> None:
     """
     Move a node by `delta` and update its velocity.
 
-    The node's position is advanced by `delta.astype(float)`. Velocity is computed
-    as (new_pos - old_pos) / dt. Anchored nodes (obj.is_anchor == True) are not moved.
+    The node's position is advanced by `delta`. Velocity is computed as
+    (new_pos - old_pos) / dt, i.e. delta / dt. Anchored nodes (obj.is_anchor == True)
+    are not moved.
 
     Parameters
     ----------
@@ -101,14 +255,44 @@ def move(obj: "NeighborBase", delta: "Vec3", dt: float = 1.0) -> None:
 
     Notes
     -----
-    This function mutates obj.pos and obj.velocity in-place.
+    This function mutates obj.pos and obj.velocity in-place and allocates no
+    temporary arrays.
     """
     if obj.is_anchor:
         return
 
-    new_pos = obj.pos + delta.astype(float)
-    obj.velocity = (new_pos - obj.pos) / dt
-    obj.pos = new_pos
+    np.divide(delta, dt, out=obj.velocity)
+    obj.pos += delta
+    obj._version += 1
+    obj._state_version += 1
+
+
+def record_position(obj: "NeighborBase") -> None:
+    """
+    Push the node's current position into its stability window.
+
+    The window is a preallocated (STABILITY_WINDOW, 3) array holding the most
+    recent positions, oldest first. It is (re)allocated when the window size
+    changes and shifted in place once full, so recording never allocates.
+
+    Parameters
+    ----------
+    obj : NeighborBase
+        Node exposing pos and STABILITY_WINDOW int.
+    """
+    window = max(2, int(obj.STABILITY_WINDOW))
+    ring = obj._pos_window
+    if ring is None or ring.shape[0] != window:
+        ring = obj._pos_window = np.empty((window, 3), dtype=np.float64)
+        obj._pos_window_len = 0
+
+    n = obj._pos_window_len
+    if n == window:
+        ring[:-1] = ring[1:]
+        n -= 1
+    ring[n] = obj.pos
+    obj._pos_window_len = n + 1
+    obj._stability = None
 
 
 def stability(obj: "NeighborBase") -> float:
@@ -117,14 +301,16 @@ def stability(obj: "NeighborBase") -> float:
 
     Lower values indicate more stable nodes (less movement between history entries).
 
-    The function inspects obj.history for entries containing a 'pos' key with
-    a numpy.ndarray of shape (3,). It uses only the last obj.STABILITY_WINDOW
-    entries (if present) to compute mean pairwise displacement.
+    Positions are recorded by record_position() each time a history snapshot
+    is taken; only the last obj.STABILITY_WINDOW of them are kept, and the
+    mean displacement between consecutive ones is computed in one pass. The
+    result is cached until the next position is recorded, since gravity
+    reads it every tick but snapshots are only taken on change.
 
     Parameters
     ----------
     obj : NeighborBase
-        Node exposing a history iterable and STABILITY_WINDOW int.
+        Node exposing a stability window and STABILITY_WINDOW int.
 
     Returns
     -------
@@ -132,40 +318,36 @@ def stability(obj: "NeighborBase") -> float:
         Average Euclidean distance between consecutive stored positions.
         Returns 0.0 if insufficient history entries exist.
     """
-    positions = []
-    for entry in obj.history:
-        pos = entry.get("pos")
-        if isinstance(pos, np.ndarray) and pos.shape == (3,):
-            positions.append(pos)
-
-    if len(positions) < 2:
-        return 0.0
-
-    # Only take the last N entries
-    positions = positions[-obj.STABILITY_WINDOW :]
-
-    # Pairwise distances
-    deltas = [np.linalg.norm(b - a) for a, b in zip(positions, positions[1:])]
+    cached = obj._stability
+    if cached is not None:
+        return cached
 
-    return float(sum(deltas) / len(deltas))
+    n = obj._pos_window_len
+    if n < 2:
+        value = 0.0
+    else:
+        deltas = np.diff(obj._pos_window[:n], axis=0)
+        value = float(np.sqrt(np.einsum("ij,ij->i", deltas, deltas)).mean())
+    obj._stability = value
+    return value
 
 
 def competition(obj: "NeighborBase") -> float:
     """
     Measure how much an object's connection attempts exceed its degree limit.
 
-    Positive values indicate the node currently has more neighbors than its
-    degree_limit(); zero indicates it is within its limit.
+    Positive values indicate more rejected connection attempts than its
+    degree_limit(); zero indicates it is within its limit. The limit is
+    read from the node's cache (_degree_limit), not by calling degree_limit().
 
     Parameters
     ----------
     obj : NeighborBase
-        Node exposing attemps (int) and degree_limit().
+        Node exposing attempts (int) and a cached _degree_limit.
 
     Returns
     -------
     float
-        max(0, len(obj.attempts) - obj.degree_limit()) as float.
+        max(0, obj.attempts - obj._degree_limit) as float.
     """
-    limit = obj.degree_limit()
-    return float(max(0, obj.attempts - limit))
+    return float(max(0, obj.attempts - obj._degree_limit))
@@ -1,13 +1,46 @@
+import math
+import sys
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import numpy as np
 
-from radiant_chacha.methods.movement import competition, stability
+from radiant_chacha.methods.movement import competition, neighbor_rows, stability
 
 if TYPE_CHECKING:
     from radiant_chacha.core.neighbor_base import NeighborBase
 
 
+def desired_neighbors(node_type: str, limit: int) -> float:
+    """
+    Return how many neighbors a node of node_type wants for compute_gravity.
+
+    Nodes prefer up to min(5, degree_limit) to avoid inflating; unlimited
+    nodes and Spheres want many, Points only one.
+
+    Parameters
+    ----------
+    node_type : str
+        Class name of the node (NeighborBase.type).
+    limit : int
+        Cached degree limit (sys.maxsize when unlimited).
+
+    Returns
+    -------
+    float
+        Desired neighbor count.
+    """
+    if limit == sys.maxsize or node_type == "Sphere":
+        # Any node with infinite degree limit should desire many neighbors
+        return 10.0
+    if node_type == "Point":
+        # Points should only have one neighbor, and so they should not desire more
+        return 1.0
+    if node_type == "Block":
+        return float(min(5, max(0, limit)))
+    return float(max(0, limit))
+
+
 def compute_gravity(obj: "NeighborBase") -> float:
     """
     Compute a scalar "gravity" value for a node based on internal heuristics.
@@ -42,33 +75,34 @@ def compute_gravity(obj: "NeighborBase") -> float:
     s: float = stability(obj=obj)
     c: float = competition(obj=obj)
 
-    # desired neighbors heuristic: prefer up to min(5, degree_limit) to avoid inflating
-    try:
-        limit = obj.degree_limit()
-        if obj.type == "Block":
-            desired = min(5.0, float(max(0.0, float(limit))))
-        if obj.type == "Point":
-            desired = 1.0  # Points should only have one neighbor, and so they should not desire more
-        if limit == float("inf") or obj.type == "Sphere":
-            desired = (
-                10.0  # Any node with infinite degree limit should desire many neighbors
-            )
-        else:
-            desired = float(max(0.0, float(limit)))
-    except Exception:
-        # I cannot think of the edge case that would cause this except block to be hit, but just in case
-        desired = 3.0
-
-    deficit = max(0.0, desired - float(len(obj.neighbors)))
+    # desired is fixed per node type and limit, so it is cached on the node
+    deficit = max(0.0, obj._desired_neighbors - float(len(obj.neighbors)))
 
     gravity: float = c - 0.5 * s + 0.5 * deficit
 
     # Clamp to reasonable bounds
-    gravity = max(0.0, min(20.0, gravity))
+    if gravity < 0.0:
+        gravity = 0.0
+    elif gravity > 20.0:
+        gravity = 20.0
 
     return float(gravity)
 
 
+def _centroid_offset(obj: "NeighborBase") -> tuple[np.ndarray, float]:
+    """Return (neighbor centroid - obj.pos, its length) as a fresh array and float.
+
+    A node without neighbors gets a zero vector and 0.0.
+    """
+    if not obj.neighbors:
+        return np.zeros(3, dtype=float), 0.0
+
+    # Gather neighbor positions straight from the shared buffer in one indexing op
+    centroid = obj.factory.pos_buf[neighbor_rows(obj)].mean(axis=0)
+    offset = centroid - obj.pos
+    return offset, math.hypot(*offset.tolist())
+
+
 def local_gravity_vector(obj: "NeighborBase") -> np.ndarray:
     """
     Return the normalized direction vector pointing toward the centroid of neighbors.
@@ -79,25 +113,19 @@ def local_gravity_vector(obj: "NeighborBase") -> np.ndarray:
     Parameters
     ----------
     obj : NeighborBase
-        Node exposing a sequence of neighbors where each neighbor has a .pos attribute.
+        Node whose neighbors are rows (``_row``) of its factory's position buffer.
 
     Returns
     -------
     numpy.ndarray
         A length-3 normalized vector (float dtype). Zero vector when no preferred direction.
     """
-    if not obj.neighbors:
-        return np.zeros(3, dtype=float)
-
-    arr = np.array([nb.pos for nb in obj.neighbors])
-    centroid = np.mean(arr, axis=0)
-    direction = centroid - obj.pos
-
-    norm = np.linalg.norm(direction)
+    direction, norm = _centroid_offset(obj)
     if norm == 0:
         return np.zeros(3)
 
-    return direction / norm
+    direction /= norm
+    return direction
 
 
 def apply_gravity(obj: "NeighborBase", dt: float = 1.0) -> None:
@@ -106,8 +134,8 @@ def apply_gravity(obj: "NeighborBase", dt: float = 1.0) -> None:
 
     Steps:
       - If obj.is_anchor is True, no changes are made.
-      - Compute and store obj.gravity via compute_gravity(obj).
-      - Obtain direction with local_gravity_vector(obj). If zero, no movement.
+      - Compute and store obj.gravity as compute_gravity(obj) would.
+      - Obtain direction as in local_gravity_vector(obj). If zero, no movement.
       - Compute delta = direction * obj.gravity * dt.
       - Update obj.pos and obj.velocity accordingly.
 
@@ -120,23 +148,116 @@ def apply_gravity(obj: "NeighborBase", dt: float = 1.0) -> None:
 
     Notes
     -----
-    This function mutates obj.pos and obj.velocity in-place.
+    This function mutates obj.pos and obj.velocity in-place, so rows of the
+    factory's shared position/velocity buffers stay in sync. compute_gravity
+    and the centroid offset are inlined here; keep them in step when either
+    heuristic changes.
     """
     if obj.is_anchor:
         return
 
-    # Compute gravity scalar and update attribute
-    obj.gravity = compute_gravity(obj)
-
-    # Get normalized direction vector
-    direction = local_gravity_vector(obj)
+    # compute_gravity, inlined: this runs once per node per tick, so the
+    # stability/competition frames and repeated attribute reads are avoided
+    neighbors = obj.neighbors
+    s = obj._stability
+    if s is None:
+        s = stability(obj)
+    c = obj.attempts - obj._degree_limit
+    deficit = obj._desired_neighbors - len(neighbors)
+    gravity = -0.5 * s
+    if c > 0:
+        gravity += c
+    if deficit > 0:
+        gravity += 0.5 * deficit
+    if gravity < 0.0:
+        gravity = 0.0
+    elif gravity > 20.0:
+        gravity = 20.0
+    if gravity != obj.gravity:
+        obj.gravity = gravity
+        obj._state_version += 1
+
+    if not neighbors:
+        return
 
-    if np.linalg.norm(direction) == 0:
+    # Offset toward the neighbor centroid; normalizing and scaling by gravity
+    # are folded into one in-place multiply of this fresh array
+    pos = obj.pos
+    offset = obj.factory.pos_buf[neighbor_rows(obj)].mean(axis=0)
+    offset -= pos
+    n2 = float(offset @ offset)
+    if n2 == 0:
         return  # No movement if no direction
 
-    # Calculate movement delta vector
-    delta = direction * obj.gravity * dt
+    delta = np.multiply(offset, gravity * dt / math.sqrt(n2), out=offset)
+
+    # Update position and velocity in place (they are views into factory buffers)
+    pos += delta
+    np.divide(delta, dt, out=obj.velocity)
+    obj._state_version += 1
+
+
+def apply_gravity_many(nodes: Sequence["NeighborBase"], dt: float = 1.0) -> None:
+    """
+    Apply gravity to many nodes of one factory in a single vectorized pass.
+
+    Gravity scalars are computed per node as in apply_gravity, then every
+    centroid, direction and delta is computed over the factory's position
+    buffer at once and written back with one in-place add.
+
+    Parameters
+    ----------
+    nodes : Sequence[NeighborBase]
+        Live nodes sharing one factory. Anchored nodes are skipped.
+    dt : float, optional
+        Time-step scale for position/velocity updates (default 1.0).
+
+    Notes
+    -----
+    All nodes move from the positions at the start of the pass, whereas
+    successive apply_gravity calls let later nodes see earlier moves. For a
+    single node the result is identical to apply_gravity.
+    """
+    movers = [obj for obj in nodes if not obj.is_anchor]
+    if not movers:
+        return
+
+    factory = movers[0].factory
+    pos_buf, vel_buf = factory.pos_buf, factory.vel_buf
+
+    n = len(movers)
+    rows = np.empty(n, dtype=np.intp)
+    counts = np.empty(n, dtype=np.intp)
+    gravity = np.empty(n, dtype=np.float64)
+    nb_rows: list[np.ndarray] = []
+    for i, obj in enumerate(movers):
+        g = compute_gravity(obj)
+        if g != obj.gravity:
+            obj.gravity = g
+            obj._state_version += 1
+        rows[i] = obj._row
+        counts[i] = len(obj.neighbors)
+        gravity[i] = obj.gravity
+        nb_rows.append(neighbor_rows(obj))
+
+    has_nb = counts > 0
+    if not has_nb.any():
+        return
 
-    # Update position and velocity
-    obj.pos = obj.pos + delta
-    obj.velocity = delta / dt
+    # Segment-sum the gathered neighbor positions into one centroid per node
+    starts = np.cumsum(counts) - counts
+    gathered = pos_buf[np.concatenate(nb_rows)]
+    centroids = np.add.reduceat(gathered, starts[has_nb]) / counts[has_nb, None]
+    rows, gravity = rows[has_nb], gravity[has_nb]
+    direction = centroids - pos_buf[rows]
+
+    norm = np.sqrt(np.einsum("ij,ij->i", direction, direction))
+    moving = norm > 0
+    rows = rows[moving]
+    delta = direction[moving]
+    delta *= (gravity[moving] * dt / norm[moving])[:, None]
+
+    pos_buf[rows] += delta
+    vel_buf[rows] = delta / dt
+    for i in np.flatnonzero(has_nb)[moving].tolist():
+        movers[i]._state_version += 1
@@ -3,17 +3,30 @@ Data similarity utilities used to decide neighbor links.
 
 Provides:
 - similarity_score(a, b) -> float in [0,1]
-- should_connect(obj, other, threshold=0.5, distance_weight=0.4) -> (bool, score)
+- should_connect(obj, other, threshold=0.5, distance_weight=0.4, dist=None) -> (bool, score)
+- should_connect_many(obj, others, threshold=0.5, distance_weight=0.4, dists=None)
+  -> (mask, scores)
+- max_connect_distance(obj, max_other_radius, threshold, distance_weight=0.4) -> float
+- unit_data_matrix(nodes) -> (matrix, norms) or None
 """
 
 import difflib
+import logging
 import math
+from collections import Counter
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Tuple
 
 import numpy as np
 
+try:
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio
+except ImportError:  # optional "rapidfuzz" extra; strings fall back to difflib
+    _fuzz_ratio = None
+
 from radiant_chacha.methods.movement import (
     distance_to,  # reuse existing distance helper
+    distances_to_many,
 )
 from radiant_chacha.utils.log_handler import get_logger
 
@@ -23,35 +36,88 @@ if TYPE_CHECKING:
 logger = get_logger(__name__, source_file=__file__)
 
 
+# dtypes _cosine_similarity takes dot products in without converting
+_DOT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
 def _cosine_similarity(a: "np.ndarray", b: "np.ndarray") -> float:
-    if np is None:
-        return 0.0
-    a_f = a.astype(float)
-    b_f = b.astype(float)
-    denom = np.linalg.norm(a_f) * np.linalg.norm(b_f)
-    if denom == 0:
+    # float32 embeddings are used as is rather than upcast, halving the bytes
+    # the dot products read; other non-float64 dtypes are converted once
+    a_f = a if a.dtype in _DOT_DTYPES else a.astype(float)
+    b_f = b if b.dtype in _DOT_DTYPES else b.astype(float)
+    # Norms from dot products: np.linalg.norm's dispatch outweighs the math on
+    # the short vectors nodes usually carry. Each is rooted before multiplying,
+    # as a product of squared norms overflows or underflows far sooner
+    den = math.sqrt(float(np.dot(a_f, a_f))) * math.sqrt(float(np.dot(b_f, b_f)))
+    if den == 0.0:
         return 0.0
-    cosine = np.dot(a_f, b_f) / denom
+    cosine = float(np.dot(a_f, b_f)) / den
     # rescale cosine from [-1,1] to [0,1]
     return float((cosine + 1.0) * 0.5)
 
 
+def _data_vector(obj: "NeighborBase") -> tuple[np.ndarray, float]:
+    """Return obj.data (an array) as a unit float array and its original norm.
+
+    A zero vector stays zero. Both are cached per data object, so they are
+    only recomputed after obj.data is reassigned; mutating the array in place
+    does not refresh them (as with update_addr's encoded data).
+    """
+    cached = obj._data_vec
+    if cached is None or cached[0] is not obj.data:
+        vec = obj.data.astype(float)
+        norm = math.sqrt(float(vec @ vec))
+        if norm:
+            vec /= norm
+        cached = obj._data_vec = (obj.data, vec, norm)
+    return cached[1], cached[2]
+
+
+# ndarray dtype kinds _data_vector can convert to float (bool, int, uint, float)
+_VECTOR_KINDS = frozenset("biuf")
+
+
+def _is_vector_pair(a: Any, b: Any) -> bool:
+    """True if a and b are numeric 1-D arrays of one length (cosine on cached vectors).
+
+    Other arrays, such as string arrays, are left to similarity_score.
+    """
+    return (
+        isinstance(a, np.ndarray)
+        and isinstance(b, np.ndarray)
+        and a.ndim == 1
+        and a.shape == b.shape
+        and a.dtype.kind in _VECTOR_KINDS
+        and b.dtype.kind in _VECTOR_KINDS
+    )
+
+
+def _node_cosine_similarity(obj: "NeighborBase", other: "NeighborBase") -> float:
+    """_cosine_similarity(obj.data, other.data) from the nodes' cached vectors."""
+    a_u, norm_a = _data_vector(obj)
+    b_u, norm_b = _data_vector(other)
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    # Cached vectors are unit length, so the cosine is their dot product
+    cosine = float(a_u @ b_u)
+    # rescale cosine from [-1,1] to [0,1]
+    return (cosine + 1.0) * 0.5
+
+
 def _dict_similarity(a: dict, b: dict) -> float:
     if not a and not b:
         return 1.0
     if not isinstance(a, dict) or not isinstance(b, dict):
         return 0.0
-    keys_a = set(a.keys())
-    keys_b = set(b.keys())
-    if not keys_a and not keys_b:
-        return 1.0
-    shared_keys = keys_a & keys_b
+    # Key views intersect in C without copying either dict's keys into a set
+    shared_keys = a.keys() & b.keys()
     if not shared_keys:
         return 0.0
-    same = 0
-    for k in shared_keys:
-        if a.get(k) == b.get(k):
-            same += 1
+    try:
+        # Equal (key, value) pairs are exactly the shared keys with equal values
+        same = len(a.items() & b.items())
+    except TypeError:  # unhashable values; shared keys exist in both dicts
+        same = sum(1 for k in shared_keys if a[k] == b[k])
     return float(same) / float(len(shared_keys))
 
 
@@ -60,26 +126,111 @@ def _string_similarity(a: str, b: str) -> float:
         return 1.0
     if not a or not b:
         return 0.0
+    # rapidfuzz computes the same 2*matches/total ratio in C++; its match
+    # count is exact, where difflib's can come out lower on long strings
+    if _fuzz_ratio is not None:
+        return _fuzz_ratio(a, b) / 100.0
     seq = difflib.SequenceMatcher(None, a, b)
     return float(seq.ratio())
 
 
+def _string_similarity_bound(a: str, b: str) -> float:
+    """Upper bound on _string_similarity(a, b) that skips the sequence matching.
+
+    Both ratios are 2 * matched chars / total chars, and no more chars can
+    match than the shorter string holds or than the strings share as
+    multisets. The multiset count is only taken when difflib would do the
+    real work, since rapidfuzz's ratio costs about as much as counting.
+    """
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    bound = 2.0 * min(len(a), len(b)) / total
+    if _fuzz_ratio is None:
+        shared = sum((Counter(a) & Counter(b)).values())
+        bound = min(bound, 2.0 * shared / total)
+    return bound
+
+
+def _array_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    # Cosine over the flattened values (np.dot of 2-D arrays would be a matrix
+    # product); ravel only copies arrays that are not contiguous
+    if a.ndim != 1:
+        a = a.ravel()
+    if b.ndim != 1:
+        b = b.ravel()
+    return _cosine_similarity(a, b)
+
+
+def _bytes_similarity(a: bytes | bytearray, b: bytes | bytearray) -> float:
+    # ASCII bytes decode one char per byte, so rapidfuzz can compare them
+    # as they are; anything else is decoded first so chars line up
+    if _fuzz_ratio is not None and a.isascii() and b.isascii():
+        if a == b:
+            return 1.0
+        if not a or not b:
+            return 0.0
+        return _fuzz_ratio(a, b) / 100.0
+    return _string_similarity(a.decode(errors="ignore"), b.decode(errors="ignore"))
+
+
+def _number_similarity(a: float, b: float) -> float:
+    # normalized closeness: 1 - relative difference (clamped)
+    if a == b:
+        return 1.0
+    denom = max(abs(a), abs(b), 1.0)
+    diff = abs(a - b) / denom
+    return float(max(0.0, 1.0 - diff))
+
+
+def _number_similarity_many(a: float, b: np.ndarray) -> np.ndarray:
+    """_number_similarity(a, x) for every x in b, as array expressions."""
+    denom = np.maximum(np.abs(b), max(abs(a), 1.0))
+    scores = 1.0 - np.abs(b - a) / denom
+    return np.maximum(scores, 0.0, out=scores)
+
+
+# Exact types _similarity_many scores with _number_similarity_many (no bool)
+_NUMBER_TYPES = (int, float)
+
+
+# Handlers for exact (type(a), type(b)) pairs, checked before the isinstance
+# cascade in similarity_score; subclasses and mixed types fall through to it
+_SIMILARITY_HANDLERS = {
+    (np.ndarray, np.ndarray): _array_similarity,
+    (dict, dict): _dict_similarity,
+    (str, str): _string_similarity,
+    (bytes, bytes): _bytes_similarity,
+    (bytearray, bytearray): _bytes_similarity,
+    (bytes, bytearray): _bytes_similarity,
+    (bytearray, bytes): _bytes_similarity,
+    (int, int): _number_similarity,
+    (float, float): _number_similarity,
+    (int, float): _number_similarity,
+    (float, int): _number_similarity,
+}
+
+
 def similarity_score(a: Any, b: Any) -> float:
     """
     Return similarity in [0,1] for two pieces of node data.
     Heuristics:
       - numpy arrays -> cosine similarity (rescaled to [0,1])
       - dicts -> fraction of equal values over shared keys
-      - str/bytes -> difflib ratio
+      - str/bytes -> matching-character ratio (rapidfuzz, else difflib)
       - fall back to equality/hash check
+
+    Common exact type pairs are dispatched through _SIMILARITY_HANDLERS with
+    one dict lookup.
     """
     try:
+        handler = _SIMILARITY_HANDLERS.get((type(a), type(b)))
+        if handler is not None:
+            return handler(a, b)
+
         # numpy vectors
-        if np is not None and isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
-            if a.shape == b.shape:
-                return _cosine_similarity(a, b)
-            # different shapes: try flatten
-            return _cosine_similarity(a.flatten(), b.flatten())
+        if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+            return _array_similarity(a, b)
 
         # dicts
         if isinstance(a, dict) and isinstance(b, dict):
@@ -87,31 +238,27 @@ def similarity_score(a: Any, b: Any) -> float:
 
         # bytes/str
         if isinstance(a, (bytes, bytearray)) and isinstance(b, (bytes, bytearray)):
-            return _string_similarity(
-                a.decode(errors="ignore"), b.decode(errors="ignore")
-            )
+            return _bytes_similarity(a, b)
         if isinstance(a, str) and isinstance(b, str):
             return _string_similarity(a, b)
 
         # numbers
         if isinstance(a, (int, float)) and isinstance(b, (int, float)):
-            # normalized closeness: 1 - relative difference (clamped)
-            if a == b:
-                return 1.0
-            denom = max(abs(a), abs(b), 1.0)
-            diff = abs(a - b) / denom
-            return float(max(0.0, 1.0 - diff))
+            return _number_similarity(a, b)
 
         # fallback to equality/hash
+        debug = logger.isEnabledFor(logging.DEBUG)
         if a == b:
-            logger.debug(
-                msg="Similarity score method must fall back to equality because data from both neighbors is equal"
-            )
+            if debug:
+                logger.debug(
+                    msg="Similarity score method must fall back to equality because data from both neighbors is equal"
+                )
             return 1.0
         try:
-            logger.debug(
-                msg="Similarity score method must fall back to hash comparison because data from both neighbors is not equal"
-            )
+            if debug:
+                logger.debug(
+                    msg="Similarity score method must fall back to hash comparison because data from both neighbors is not equal"
+                )
             return 1.0 if hash(a) == hash(b) else 0.0
         except Exception:
             logger.warning(msg="Similarity score method experienced a hash exception")
@@ -129,6 +276,7 @@ def should_connect(
     other: "NeighborBase",
     threshold: float = 0.5,
     distance_weight: float = 0.4,
+    dist: float | None = None,
 ) -> Tuple[bool, float]:
     """
     Decide whether `obj` should attempt to connect to `other`.
@@ -140,20 +288,22 @@ def should_connect(
     an `influence_radius` attribute it will be used to normalize distance; otherwise a simple
     1/(1+dist) scaling is applied.
 
-    Returns (should_connect: bool, score: float)
-    """
-    # Prefer the formal protocol attribute 'data' but fall back to common legacy names
-    data_a = obj.data
+    Callers that already know distance_to(obj, other) may pass it as dist.
 
-    data_b = other.data
-
-    data_sim = similarity_score(data_a, data_b)
+    Proximity is computed first. When even a perfect data similarity could
+    not reach the threshold, data similarity is not computed and the score
+    returned is that upper bound; with distance_weight 1.0 data similarity
+    is skipped altogether. String data gets a second, tighter bound
+    from lengths and shared characters before the ratio is computed.
 
+    Returns (should_connect: bool, score: float)
+    """
     # compute a proximity score in [0,1]
-    try:
-        dist = distance_to(obj, other)
-    except Exception:
-        dist = math.inf
+    if dist is None:
+        try:
+            dist = distance_to(obj, other)
+        except Exception:
+            dist = math.inf
 
     # choose normalization radius
     radius_a = obj.influence_radius
@@ -176,10 +326,214 @@ def should_connect(
     else:
         proximity = 0.0
 
+    # data_sim is at most 1.0, which bounds the score; skip the (for strings,
+    # difflib) data similarity when even that bound misses the threshold
+    upper = (1.0 - distance_weight) + float(distance_weight) * float(proximity)
+    if upper < float(threshold):
+        if upper < 0.0:
+            upper = 0.0
+        elif upper > 1.0:
+            upper = 1.0
+        return False, upper
+    # Data carries no weight, so proximity alone is the score
+    if distance_weight == 1.0:
+        score = float(proximity)
+        return score >= float(threshold), score
+
+    data_a = obj.data
+    data_b = other.data
+
+    # Tighter bound for strings from their lengths and shared chars, checked
+    # before the ratio (or its cached value) is looked up
+    if type(data_a) is str and type(data_b) is str:
+        upper = (1.0 - distance_weight) * _string_similarity_bound(
+            data_a, data_b
+        ) + float(distance_weight) * float(proximity)
+        if upper < float(threshold):
+            if upper < 0.0:
+                upper = 0.0
+            elif upper > 1.0:
+                upper = 1.0
+            return False, upper
+
+    if _is_vector_pair(data_a, data_b):
+        data_sim = _node_cosine_similarity(obj, other)
+    else:
+        data_sim = _pair_similarity(obj, other)
+
     score = (1.0 - distance_weight) * float(data_sim) + float(distance_weight) * float(
         proximity
     )
-    score = float(max(0.0, min(1.0, score)))
+    # Clamp in place: avoids two builtin calls on this per-pair path
+    if score < 0.0:
+        score = 0.0
+    elif score > 1.0:
+        score = 1.0
 
     should = score >= float(threshold)
     return should, score
+
+
+# Immutable data types whose pair scores _pair_similarity caches; their
+# similarities (difflib/rapidfuzz ratios) cost far more than a dict lookup
+_CACHED_TYPES = (str, bytes)
+
+# Per-node cap on cached pair scores; a full cache is dropped and refilled
+_PAIR_CACHE_SIZE = 1024
+
+
+def _pair_similarity(obj: "NeighborBase", other: "NeighborBase") -> float:
+    """similarity_score(obj.data, other.data), cached on obj for str/bytes data.
+
+    Entries are keyed by other.id and hold both data objects, so a score is
+    reused only while neither node's data has been reassigned. Since only
+    immutable data is cached, a reused score is always current.
+    """
+    data_a, data_b = obj.data, other.data
+    if type(data_a) not in _CACHED_TYPES or type(data_b) not in _CACHED_TYPES:
+        return similarity_score(data_a, data_b)
+
+    cache = obj._pair_scores
+    if cache is None:
+        cache = obj._pair_scores = {}
+    else:
+        entry = cache.get(other.id)
+        if entry is not None and entry[0] is data_a and entry[1] is data_b:
+            return entry[2]
+        if len(cache) >= _PAIR_CACHE_SIZE:
+            cache.clear()
+    score = similarity_score(data_a, data_b)
+    cache[other.id] = (data_a, data_b, score)
+    return score
+
+
+def unit_data_matrix(
+    nodes: Sequence["NeighborBase"],
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Stack the nodes' cached unit data vectors, one row per buffer row (_row).
+
+    Returns (matrix, norms), or None unless every node's data is a numeric
+    1-D array of one length. matrix @ matrix.T would hold every pairwise cosine; the
+    factory keeps this for a tick_all() step so _similarity_many can gather
+    only the candidate rows it needs.
+    """
+    if not nodes:
+        return None
+    first = nodes[0].data
+    if not all(_is_vector_pair(first, node.data) for node in nodes):
+        return None
+    matrix = np.empty((len(nodes), first.shape[0]), dtype=float)
+    norms = np.empty(len(nodes), dtype=float)
+    for node in nodes:
+        matrix[node._row], norms[node._row] = _data_vector(node)
+    return matrix, norms
+
+
+def _similarity_many(
+    obj: "NeighborBase", others: Sequence["NeighborBase"]
+) -> np.ndarray:
+    """Data similarity of obj to every node in others, as a float array.
+
+    When obj's and every other node's data are numeric 1-D arrays of one length,
+    the cosine similarities come from a single matrix-vector product over
+    the nodes' cached unit vectors. Plain int/float data is scored with
+    array expressions too; any other mix of data falls back to
+    similarity_score per pair. During tick_all() the vectors are gathered
+    from the factory's unit_data_matrix() instead.
+    """
+    stacked = getattr(obj.factory, "_data_matrix", None)
+    if stacked is not None:
+        matrix, norms = stacked
+        rows = np.fromiter(
+            (other._row for other in others), dtype=np.intp, count=len(others)
+        )
+        cosine = matrix[rows] @ matrix[obj._row]
+        cosine[(norms[rows] * norms[obj._row]) == 0] = -1.0
+        return (cosine + 1.0) * 0.5
+
+    data = obj.data
+    if all(_is_vector_pair(data, other.data) for other in others):
+        query, norm = _data_vector(obj)
+        vectors = [_data_vector(other) for other in others]
+        matrix = np.array([vec for vec, _ in vectors])
+        norms = np.fromiter((n for _, n in vectors), dtype=float, count=len(vectors))
+        cosine = matrix @ query
+        cosine[(norms * norm) == 0] = -1.0
+        # rescale cosine from [-1,1] to [0,1]; zero-norm pairs score 0.0
+        return (cosine + 1.0) * 0.5
+    if type(data) in _NUMBER_TYPES and all(
+        type(other.data) in _NUMBER_TYPES for other in others
+    ):
+        values = np.fromiter(
+            (other.data for other in others), dtype=float, count=len(others)
+        )
+        return _number_similarity_many(data, values)
+    return np.array([_pair_similarity(obj, other) for other in others], dtype=float)
+
+
+def should_connect_many(
+    obj: "NeighborBase",
+    others: Sequence["NeighborBase"],
+    threshold: float = 0.5,
+    distance_weight: float = 0.4,
+    dists: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized should_connect(obj, other) for every node in others.
+
+    Data similarities, proximities and final scores are computed as array
+    expressions over all candidates at once (see _similarity_many for when
+    data similarity is batched too). Nodes are assumed to have numeric
+    influence radii, as NeighborBase declares.
+
+    Callers that already know distances_to_many(obj, others) may pass it as dists.
+
+    Returns (should_connect mask, scores), both aligned with others.
+    """
+    if not others:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=float)
+
+    data_sim = _similarity_many(obj, others)
+
+    if dists is None:
+        dists = distances_to_many(obj, others)
+
+    radius_b = np.fromiter(
+        (other.influence_radius for other in others), dtype=float, count=len(others)
+    )
+    radius = np.maximum(1.0, (float(obj.influence_radius) + radius_b) / 2.0)
+    # decay over twice the radius; unreachable (infinite) distances score 0
+    proximity = np.maximum(0.0, 1.0 - dists / (radius * 2.0))
+    proximity[~np.isfinite(dists)] = 0.0
+
+    scores = (1.0 - distance_weight) * data_sim + float(distance_weight) * proximity
+    np.clip(scores, 0.0, 1.0, out=scores)
+
+    return scores >= float(threshold), scores
+
+
+def max_connect_distance(
+    obj: "NeighborBase",
+    max_other_radius: float,
+    threshold: float = 0.5,
+    distance_weight: float = 0.4,
+) -> float:
+    """
+    Upper bound on the distance at which should_connect(obj, other) can pass.
+
+    With data similarity at most 1.0, a score >= threshold needs
+      proximity >= (threshold - (1 - distance_weight)) / distance_weight
+    and proximity = 1 - dist / (2 * radius) then bounds dist. radius is the
+    averaged influence radius, so the largest radius any other node may have
+    (max_other_radius) gives a bound valid for every candidate.
+
+    Returns math.inf when data similarity alone can reach the threshold.
+    """
+    if distance_weight <= 0.0:
+        return math.inf
+    min_proximity = (float(threshold) - (1.0 - distance_weight)) / distance_weight
+    if min_proximity <= 0.0:
+        return math.inf
+    radius = max(1.0, (float(obj.influence_radius) + float(max_other_radius)) / 2.0)
+    # small slack so float rounding never prunes a borderline candidate
+    return radius * 2.0 * (1.0 - min_proximity) + 1e-9
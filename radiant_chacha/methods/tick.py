@@ -3,6 +3,7 @@
 # Default loop step
 # ------------------------------------------------------------------
 
+import logging
 from pprint import pformat
 from typing import TYPE_CHECKING
 
@@ -39,11 +40,20 @@ def tick(obj: "NeighborBase", dt: float = 1.0, print_stats: bool = False) -> Non
     # Apply physics-based movement
     apply_gravity(obj=obj, dt=dt)
 
-    # Optionally log positions and gravity
-    if print_stats:
+    # Invalidate cached serializations of this node
+    obj._version += 1
+
+    # Optionally log positions and gravity; messages are only formatted (and
+    # the history only pretty-printed) when their level is enabled
+    if print_stats and logger.isEnabledFor(logging.INFO):
         logger.info(
-            f"Node {obj.id} ({type(obj)}): Pos={obj.pos} Gravity={float(obj.gravity):.3f}"
+            "Node %s (%s): Pos=%s Gravity=%.3f",
+            obj.id,
+            type(obj),
+            obj.pos,
+            float(obj.gravity),
         )
-        logger.debug("-" * 40)
-        logger.debug(f"History:\n{pformat(obj.history, width=80, indent=2)}")
-        logger.debug("-" * 40)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("-" * 40)
+            logger.debug("History:\n%s", pformat(obj.history, width=80, indent=2))
+            logger.debug("-" * 40)
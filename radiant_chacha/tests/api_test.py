@@ -0,0 +1,115 @@
+import orjson
+from fastapi.testclient import TestClient
+
+from radiant_chacha.api.json_rpc import _encode_frame, app, set_factory
+from radiant_chacha.core.factory import NeighborFactory
+from radiant_chacha.interfaces.block import Block
+from radiant_chacha.methods import record_history
+from radiant_chacha.utils.log_handler import get_logger
+
+logger = get_logger(__name__, source_file=__file__)
+
+# Wider than orjson's 64-bit integer range, which json.dumps accepts
+WIDE_INT = 2**70
+
+
+def _client() -> tuple[NeighborFactory, TestClient]:
+    """Register a fresh factory and return it with a client (no lifespan)."""
+    factory = NeighborFactory()
+    set_factory(factory)
+    return factory, TestClient(app)
+
+
+def test_api_create_list_status_history():
+    factory, client = _client()
+
+    resp = client.post(
+        "/nodes",
+        json={"node_type": "Block", "data": {"key": "value"}, "pos": [1, 2, 3]},
+    )
+    assert resp.status_code == 200
+    created = resp.json()
+    assert created["type"] == "Block"
+    assert created["pos"] == [1.0, 2.0, 3.0]
+    assert created["data_serialized"] == {"key": "value"}
+    assert client.post("/nodes", json={"node_type": "Point"}).status_code == 200
+    assert client.post("/nodes", json={"node_type": "Cube"}).status_code == 400
+
+    listed = client.get("/nodes").json()
+    assert [n["id"] for n in listed] == [node.id for node in factory.nodes]
+    fetched = client.get(f"/nodes/{created['id']}").json()
+    assert (fetched["id"], fetched["pos"]) == (created["id"], created["pos"])
+    assert client.get("/nodes/999").status_code == 404
+
+    status = client.get("/simulation/status").json()
+    assert status["running"] is True
+    assert status["node_count"] == 2
+    assert status["nodes"] == listed
+
+    record_history(factory.get_by_id(created["id"]))
+    history = client.get(f"/nodes/{created['id']}/history").json()
+    assert history
+    assert history[-1]["pos"] == [1.0, 2.0, 3.0]
+    assert history[-1]["data_type"] == "dict"
+
+
+def test_api_wide_int_payload():
+    _, client = _client()
+
+    # orjson cannot encode the int, so the payload falls back to its str()
+    resp = client.post("/nodes", json={"node_type": "Block", "data": {"x": WIDE_INT}})
+    assert resp.status_code == 200
+    assert resp.json()["data_serialized"] == str({"x": WIDE_INT})
+
+    node_id = resp.json()["id"]
+    assert client.get("/nodes").status_code == 200
+    assert client.get("/simulation/status").status_code == 200
+    assert client.get(f"/nodes/{node_id}").status_code == 200
+
+
+def test_api_list_after_release():
+    factory, client = _client()
+    ids = [
+        client.post("/nodes", json={"node_type": "Block", "pos": [i, i, i]}).json()[
+            "id"
+        ]
+        for i in range(3)
+    ]
+    # Cache every node dict, then move the last node into the freed row
+    assert len(client.get("/nodes").json()) == 3
+    factory.release(factory.get_by_id(ids[0]))
+
+    # The reused row must not show up as the moved node's position
+    client.post("/nodes", json={"node_type": "Block", "pos": [-1, -1, -1]})
+    expected = {node.id: node.pos.tolist() for node in factory.nodes}
+    listed = {n["id"]: n["pos"] for n in client.get("/nodes").json()}
+    assert ids[0] not in listed
+    assert listed == expected
+    assert client.get(f"/nodes/{ids[2]}").json()["pos"] == expected[ids[2]]
+    frame = orjson.loads(_encode_frame())
+    assert {n["id"]: n["pos"] for n in frame["nodes"]} == expected
+
+
+def test_api_websocket_frame():
+    factory = NeighborFactory()
+    set_factory(factory)
+    factory.create(Block, data="frame")
+    factory.create(Block, data={"x": WIDE_INT})
+    # Encode directly first: a frame that fails to encode is never sent, and
+    # receive_bytes() below would wait forever
+    assert orjson.loads(_encode_frame())["node_count"] == 2
+
+    with TestClient(app) as client, client.websocket_connect("/ws/nodes") as ws:
+        frame = orjson.loads(ws.receive_bytes())
+
+    assert frame["node_count"] == 2
+    assert [n["id"] for n in frame["nodes"]] == [1, 2]
+    assert len(frame["nodes"][0]["pos"]) == 3
+    assert frame["nodes"][1]["data_serialized"] == str({"x": WIDE_INT})
+
+
+if __name__ == "__main__":
+    test_api_create_list_status_history()
+    test_api_wide_int_payload()
+    test_api_list_after_release()
+    test_api_websocket_frame()
@@ -1,9 +1,29 @@
+import sys
+from collections import deque
+
 import numpy as np
 
+from radiant_chacha.config import HISTORY_MAX_LENGTH
 from radiant_chacha.core.factory import NeighborFactory
 from radiant_chacha.interfaces.block import Block
 from radiant_chacha.interfaces.point import Point
 from radiant_chacha.interfaces.sphere import Sphere
+from radiant_chacha.methods import (
+    add_neighbor,
+    apply_gravity,
+    apply_gravity_many,
+    compute_gravity,
+    move,
+    neighbor_rows,
+    record_history,
+)
+from radiant_chacha.methods.discovery import discover_and_negotiate
+from radiant_chacha.methods.similarity import (
+    should_connect,
+    should_connect_many,
+    similarity_score,
+    unit_data_matrix,
+)
 from radiant_chacha.utils.log_handler import get_logger
 
 logger = get_logger(__name__, source_file=__file__)
@@ -33,8 +53,280 @@ def test_factory():
         assert obj.addr is not None
         assert len(obj.addr) == 64
 
+    # Per-class parameter overrides reach the cached degree limit
+    hub = factory.create(Point, max_degree=3)
+    assert hub.degree_limit() == hub._degree_limit == 3
+    assert point._degree_limit == 1
+    # An unlimited degree is cached as an int
+    assert sphere._degree_limit == sys.maxsize
+    assert (sphere._desired_neighbors, block._desired_neighbors) == (10.0, 5.0)
+    assert hub._desired_neighbors == 1.0
+
+    # Nodes are indexed by ID
+    assert factory.get_by_id(2) is point
+    assert factory.get_by_id(99) is None
+
     logger.info("All tests passed.")
 
 
+def test_factory_buffers_survive_growth():
+    factory = NeighborFactory()
+
+    nodes = [
+        factory.create(Block, pos=np.array([float(i), 0.0, 0.0])) for i in range(100)
+    ]
+
+    # Every node's pos must still be a live row of the (regrown) buffer
+    for i, node in enumerate(nodes):
+        assert np.shares_memory(node.pos, factory.pos_buf)
+        assert node.pos[0] == float(i)
+
+    nodes[5].pos += 1.0
+    assert factory.positions()[5].tolist() == [6.0, 1.0, 1.0]
+    assert factory.positions().shape == (100, 3)
+
+
+def test_factory_nodes_within():
+    factory = NeighborFactory()
+
+    near = factory.create(Point, pos=np.array([1.0, 0.0, 0.0]))
+    factory.create(Point, pos=np.array([5.0, 0.0, 0.0]))
+    edge = factory.create(Point, pos=np.array([0.0, 2.0, 0.0]))
+
+    assert factory.nodes_within(np.zeros(3), 2.0) == [near, edge]
+    assert factory.nodes_within(np.zeros(3), 0.5) == []
+    assert factory.max_influence_radius == 3.0
+
+
+def test_factory_create_many():
+    factory = NeighborFactory()
+    factory.create(Sphere, pos=[0.0, 0.0, 0.0])
+
+    blocks = factory.create_many(
+        Block, [{"data": i, "pos": [float(i), 0.0, 0.0]} for i in range(100)]
+    )
+
+    assert [b.id for b in blocks] == list(range(2, 102))
+    assert blocks[7].data == 7 and blocks[7].pos[0] == 7.0
+    assert len({b.addr for b in blocks}) == 100
+    assert factory.nodes_snapshot[1:] == tuple(blocks)
+
+
+def test_factory_release_reuses_nodes():
+    factory = NeighborFactory()
+    a, b, c = factory.create_many(
+        Block, [{"pos": [float(i), 0.0, 0.0]} for i in range(3)]
+    )
+    add_neighbor(a, b)
+    add_neighbor(b, a)
+
+    record_history(a)
+    hist_vectors = a._hist_vectors
+    factory.release(a)
+
+    # The last node moves into the freed row and a is unlinked everywhere
+    assert factory.nodes_snapshot == (c, b)
+    assert factory.positions().tolist() == [[2.0, 0.0, 0.0], [1.0, 0.0, 0.0]]
+    assert np.shares_memory(c.pos, factory.pos_buf) and c._row == 0
+    assert b.neighbors == [] and not b._neighbor_id_set
+    assert factory.get_by_id(a.id) is None
+
+    d = factory.create(Block, data="reused", connection_threshold=0.9)
+    assert d is a
+    assert d.id == 4 and d.data == "reused" and d.connection_threshold == 0.9
+    assert d.neighbors == [] and len(d.history) == 0
+    assert d._hist_vectors is hist_vectors and d._pos_window_len == 0
+    assert np.shares_memory(d.pos, factory.pos_buf)
+
+
+def test_factory_release_refreshes_neighbor_rows():
+    factory = NeighborFactory()
+    a, b, c = factory.create_many(Block, [{} for _ in range(3)])
+    add_neighbor(b, c)
+    assert neighbor_rows(b).tolist() == [2]
+
+    # c takes over a's row, so b's cached rows must follow it
+    factory.release(a)
+    assert neighbor_rows(b).tolist() == [0]
+
+
+def test_factory_release_bumps_moved_node_version():
+    factory = NeighborFactory()
+    a, _, c = factory.create_many(Block, [{} for _ in range(3)])
+    released = []
+    factory.release_hooks.append(released.append)
+
+    # Cached serializations of c hold views of its old row, so c must change
+    version = c._version
+    factory.release(a)
+    assert c._version == version + 1
+    assert released == [a]
+
+
+def test_factory_batched_should_connect_matches_per_pair():
+    factory = NeighborFactory()
+    origin = factory.create(Block, data=np.array([1.0, 0.0]), pos=[0.0, 0.0, 0.0])
+    others = [
+        factory.create(Block, data=np.array([1.0, 1.0]), pos=[2.0, 0.0, 0.0]),
+        factory.create(Point, data=np.zeros(2), pos=[0.0, 9.0, 0.0]),
+        factory.create(Sphere, data=np.array([-1.0, 0.0]), pos=[1.0, 1.0, 1.0]),
+    ]
+    words = [factory.create(Block, data=w) for w in ("lunar", "lunch", "biscuit")]
+    numbers = [factory.create(Point, data=v) for v in (4, 5.0, -2.5, 40)]
+
+    for obj, cands in (
+        (origin, others),
+        (words[0], words[1:]),
+        (numbers[0], numbers[1:]),
+    ):
+        mask, scores = should_connect_many(obj, cands, threshold=0.5)
+        expected = [should_connect(obj, cand, threshold=0.5) for cand in cands]
+        assert mask.tolist() == [ok for ok, _ in expected]
+        assert np.allclose(scores, [score for _, score in expected])
+
+    # String scores are cached per pair of data objects
+    assert words[0]._pair_scores[words[1].id][2] == similarity_score("lunar", "lunch")
+    assert origin._pair_scores is None
+    # A bound from lengths and shared chars may reject before the ratio runs
+    ok, score = should_connect(words[0], words[2], threshold=0.95)
+    assert not ok and score >= similarity_score("lunar", "biscuit")
+
+    # Norms are multiplied after rooting, so large and tiny vectors stay exact
+    for scale in (1e80, 1e-90):
+        assert similarity_score(np.array([scale, 0.0]), np.array([scale, 0.0])) == 1.0
+
+    # Matrices are compared as flattened vectors, whatever their shapes
+    assert np.isclose(similarity_score(np.eye(2), np.eye(2)), 1.0)
+    assert np.isclose(similarity_score(np.eye(2), np.array([1.0, 0.0, 0.0, 1.0])), 1.0)
+
+    # Dicts score the share of common keys with equal values, hashable or not
+    assert similarity_score({"a": 1, "b": 2, "c": 3}, {"a": 1, "b": 0}) == 0.5
+    assert similarity_score({"a": [1], "b": {}}, {"a": [1], "b": {"x": 1}}) == 0.5
+
+    # Array data is converted and normed once per data object
+    assert origin._data_vec[0] is origin.data and origin._data_vec[2] == 1.0
+    # and kept at unit length, so cosine similarity is a plain dot product
+    assert np.allclose(others[0]._data_vec[1], [0.5**0.5] * 2)
+    assert others[1]._data_vec[2] == 0.0
+
+    # Gathering from a stacked matrix (as tick_all does) scores the same;
+    # mixed data cannot be stacked
+    assert unit_data_matrix(factory.nodes_snapshot) is None
+    vectors = NeighborFactory()
+    nodes = [vectors.create(Block, data=obj.data, pos=obj.pos) for obj in others]
+    nodes.insert(0, vectors.create(Block, data=origin.data, pos=origin.pos))
+    expected = should_connect_many(nodes[0], nodes[1:])
+    vectors._data_matrix = unit_data_matrix(vectors.nodes_snapshot)
+    mask, scores = should_connect_many(nodes[0], nodes[1:])
+    assert mask.tolist() == expected[0].tolist()
+    assert np.allclose(scores, expected[1])
+
+
+def test_factory_string_arrays_skip_cached_vectors():
+    factory = NeighborFactory()
+    a = factory.create(Block, data=np.array(["a", "b"]), pos=[0.0, 0.0, 0.0])
+    b = factory.create(Block, data=np.array(["a", "c"]), pos=[1.0, 0.0, 0.0])
+
+    # Non-numeric arrays are scored by similarity_score, not as float vectors
+    _, score = should_connect(a, b, distance_weight=0.0)
+    assert score == similarity_score(a.data, b.data)
+    assert a._data_vec is None and b._data_vec is None
+    discover_and_negotiate(a)
+
+    # Nor can they be stacked or batched with same-length float vectors
+    c = factory.create(Block, data=np.array([1.0, 0.0]), pos=[0.0, 1.0, 0.0])
+    assert unit_data_matrix(factory.nodes_snapshot) is None
+    mask, scores = should_connect_many(c, [a, b])
+    expected = [should_connect(c, other) for other in (a, b)]
+    assert mask.tolist() == [ok for ok, _ in expected]
+    assert np.allclose(scores, [score for _, score in expected])
+    factory.tick_all(dt=0.1)
+
+
+def test_factory_batched_gravity_matches_per_node():
+    def build():
+        factory = NeighborFactory()
+        sphere = factory.create(Sphere, pos=[0.0, 0.0, 0.0])
+        block = factory.create(Block, pos=[3.0, 0.0, 0.0])
+        factory.create(Point, pos=[5.0, 5.0, 5.0])
+        add_neighbor(block, sphere)
+        add_neighbor(sphere, block)
+        return factory
+
+    expected = build()
+    for node in expected.nodes_snapshot:
+        apply_gravity(node, dt=0.5)
+        # The inlined gravity scalar matches the reference heuristic
+        assert node.is_anchor or node.gravity == compute_gravity(node)
+
+    batched = build()
+    apply_gravity_many(batched.nodes_snapshot, dt=0.5)
+
+    # Only the block has a neighbor to fall toward; the sphere is an anchor
+    assert np.allclose(batched.positions(), expected.positions())
+    assert np.allclose(batched.velocities(), expected.velocities())
+    assert batched.positions()[1, 0] < 3.0
+    assert batched.positions()[2].tolist() == [5.0, 5.0, 5.0]
+
+
+def test_factory_history_skips_unchanged_nodes():
+    factory = NeighborFactory()
+    sphere = factory.create(Sphere, pos=[0.0, 0.0, 0.0])
+    block = factory.create(Block, pos=[1.0, 0.0, 0.0])
+    add_neighbor(sphere, block)
+
+    record_history(block)
+    record_history(sphere)
+    record_history(sphere)
+    assert len(sphere.history) == 1
+
+    # A neighbor's new address is recorded even though the sphere is idle
+    move(block, np.ones(3))
+    record_history(block)
+    record_history(sphere)
+    assert len(sphere.history) == 2
+    assert sphere.history[-1]["neighbors"][0]["addr"] == block.addr
+    assert block._addr_bytes == block.addr.encode()
+
+    # Moving along a single axis is a change too, even at unchanged velocity
+    for _ in range(2):
+        move(block, np.array([0.5, 0.0, 0.0]))
+        record_history(block)
+    assert len(block.history) == 4
+    # Unchanged neighbor summaries are shared between entries
+    assert block.history[-1]["neighbors"] is block.history[-2]["neighbors"]
+
+
+def test_factory_history_vectors_wrap():
+    factory = NeighborFactory()
+    block = factory.create(Block, pos=[0.0, 0.0, 0.0], history=deque(maxlen=3))
+
+    for _ in range(10):
+        move(block, np.array([1.0, 0.0, 0.0]))
+        record_history(block)
+
+    # Entries share one ring of vectors, and a row is reused only once dropped
+    assert [e["idx"] for e in block.history] == [7, 8, 9]
+    assert [e["pos"][0] for e in block.history] == [8.0, 9.0, 10.0]
+    assert block.history[-1]["velocity"].tolist() == [1.0, 0.0, 0.0]
+    assert block._hist_vectors.shape == (3, 2, 3)
+    assert not block.history[-1]["pos"].flags.writeable
+
+    # An unbounded history passed at creation is capped like the default
+    point = factory.create(Point, history=[])
+    assert point.history.maxlen == HISTORY_MAX_LENGTH
+
+
 if __name__ == "__main__":
     test_factory()
+    test_factory_buffers_survive_growth()
+    test_factory_nodes_within()
+    test_factory_create_many()
+    test_factory_release_reuses_nodes()
+    test_factory_release_refreshes_neighbor_rows()
+    test_factory_release_bumps_moved_node_version()
+    test_factory_batched_should_connect_matches_per_pair()
+    test_factory_string_arrays_skip_cached_vectors()
+    test_factory_batched_gravity_matches_per_node()
+    test_factory_history_skips_unchanged_nodes()
+    test_factory_history_vectors_wrap()
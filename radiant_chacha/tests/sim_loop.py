@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import logging
 from pprint import pformat
 
 import numpy as np
@@ -13,7 +14,20 @@ from radiant_chacha.utils.log_handler import get_logger
 logger = get_logger(__name__, source_file=__file__)
 
 
-async def simulation(t: int) -> None:
+async def _run_batched(factory: NeighborFactory, t: int, dt: float) -> None:
+    """Step every node with factory.tick_all(dt) every dt seconds for t seconds.
+
+    Steps run in the loop's default executor, so the event loop stays free
+    while the batched NumPy work (which releases the GIL) runs.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + t
+    while loop.time() < deadline:
+        await loop.run_in_executor(None, factory.tick_all, dt)
+        await asyncio.sleep(dt)
+
+
+async def simulation(t: int, batch_dt: float | None = None) -> None:
     logger.info("Starting simulation...")
     nodes = []
     try:
@@ -96,6 +110,10 @@ async def simulation(t: int) -> None:
         # add_neighbor(obj=block, other=sphere)
         # add_neighbor(obj=point, other=block)
 
+        if batch_dt is not None:
+            await _run_batched(factory, t, batch_dt)
+            return
+
         tasks = [asyncio.create_task(node.run(print_stats=True)) for node in nodes]
 
         await asyncio.sleep(t)
@@ -111,9 +129,13 @@ async def simulation(t: int) -> None:
             )
             logger.info("-" * 40)
             logger.info("Set logging to debug to see full history details.")
-            logger.debug(
-                f"History of Node {i} ({type(node)}):\n{pformat(node.history, width=80, indent=2)}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "History of Node %s (%s):\n%s",
+                    i,
+                    type(node),
+                    pformat(node.history, width=80, indent=2),
+                )
             logger.info("-" * 40)
             logger.info(
                 f"Total attempts to connect beyond degree limit for Node {i} ({type(node)}): {node.attempts}"
@@ -125,5 +147,11 @@ if __name__ == "__main__":
     parser.add_argument(
         "-t", "--time", type=int, default=10, help="Simulation time in seconds"
     )
+    parser.add_argument(
+        "--batch-dt",
+        type=float,
+        default=None,
+        help="Step all nodes together every BATCH_DT seconds instead of per-node ticks",
+    )
     args = parser.parse_args()
-    asyncio.run(simulation(t=args.time))
+    asyncio.run(simulation(t=args.time, batch_dt=args.batch_dt))
@@ -1,4 +1,5 @@
 import logging
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -72,8 +73,8 @@ def get_logger(
     logger.propagate = False
 
     formatter = logging.Formatter("%(asctime)sZ %(levelname)-8s %(name)s: %(message)s")
-    # Use UTC timestamps
-    formatter.converter = lambda *args: datetime.now(timezone.utc).timetuple()
+    # Use UTC timestamps, converted from the record's own creation time
+    formatter.converter = time.gmtime
 
     # Stream handler (stdout) - add if LOG_DESTINATION is "stdout" or "both"
     if LOG_DESTINATION in ("stdout", "both"):
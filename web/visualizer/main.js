@@ -93,50 +93,21 @@ const templateMaterial = (color) =>
     emissiveIntensity: 0.4,
   });
 
-function createEdgeMesh(start, end) {
-  const direction = new THREE.Vector3().subVectors(end, start);
-  const length = direction.length();
-  if (!length) {
-    return null;
-  }
-
-  const mesh = new THREE.Mesh(baseEdgeGeometry, baseEdgeMaterial);
-  const midpoint = new THREE.Vector3().addVectors(start, end).multiplyScalar(0.5);
-  mesh.position.copy(midpoint);
-  mesh.scale.set(connectorThicknessScale, length, connectorThicknessScale);
-  const quaternion = new THREE.Quaternion().setFromUnitVectors(
-    upAxis,
-    direction.normalize()
-  );
-  mesh.quaternion.copy(quaternion);
-  return mesh;
-}
-
-function createEdgeDots(start, end) {
-  const direction = new THREE.Vector3().subVectors(end, start);
-  const length = direction.length();
-  if (!length) {
-    return null;
-  }
-
-  const steps = Math.max(2, Math.ceil(length / 1.25));
-  const group = new THREE.Group();
-  for (let i = 0; i <= steps; i += 1) {
-    const ratio = i / steps;
-    const position = new THREE.Vector3().copy(start).lerp(end, ratio);
-    const dot = new THREE.Mesh(baseDotGeometry, baseDotMaterial);
-    dot.position.copy(position);
-    dot.scale.set(connectorThicknessScale, connectorThicknessScale, connectorThicknessScale);
-    group.add(dot);
-  }
-  return group;
-}
+// Scratch values reused while writing edge and dot instance matrices
+const edgeMatrix = new THREE.Matrix4();
+const edgeMidpoint = new THREE.Vector3();
+const edgeDirection = new THREE.Vector3();
+const edgeQuaternion = new THREE.Quaternion();
+const edgeScale = new THREE.Vector3();
+const dotPosition = new THREE.Vector3();
 
 const nodeMeshes = new Map();
 const raycaster = new THREE.Raycaster();
 const mouse = new THREE.Vector2();
 const tooltip = document.getElementById("tooltip");
 const tableBody = document.querySelector("#node-table tbody");
+// Markup last written to tableBody; unchanged tables skip the DOM rewrite
+let renderedTableHtml = "";
 const nodeForm = document.getElementById("node-form");
 const formStatus = document.getElementById("form-status");
 const formSubmitButton = nodeForm?.querySelector("button[type='submit']");
@@ -179,6 +150,13 @@ const MAX_POSITION_SCALE = 420;
 const CAMERA_FOCUS_MIN_DISTANCE = 8;
 const CAMERA_FOCUS_MAX_DISTANCE = 26;
 const CAMERA_TWEEN_DURATION = 650;
+// Above this many dots, connectors are drawn as plain cylinders; the dot
+// count grows with edge length and dominates the edge rebuild at scale
+const MAX_CONNECTOR_DOTS = 20000;
+// Above this many edges, connectors are not drawn at all (see rebuildEdges)
+const MAX_DRAWN_EDGES = 10000;
+// Only this many rows are formatted into the node table per frame
+const MAX_TABLE_ROWS = 50;
 edgesGroup.visible = connectorVisibleCheckbox ? connectorVisibleCheckbox.checked : true;
 
 function readStoredTableHeight() {
@@ -233,11 +211,17 @@ function getScaledPositionVector(values) {
   return vectorFromArray(values).multiplyScalar(currentPositionScale);
 }
 
-function updatePositionScale(nodes) {
+// One pass over a payload's nodes: fills the id lookups, sums gravity for the
+// stats panel and finds the bounding box behind the position scale. Returns
+// the average gravity.
+function indexNodes(nodes) {
+  idToNodeMap = new Map();
+  idToAddressMap = new Map();
   if (!Array.isArray(nodes) || !nodes.length) {
     currentPositionScale = 1;
-    return;
+    return 0;
   }
+  let gravitySum = 0;
   let minX = Infinity;
   let minY = Infinity;
   let minZ = Infinity;
@@ -246,6 +230,9 @@ function updatePositionScale(nodes) {
   let maxZ = -Infinity;
 
   nodes.forEach((node) => {
+    idToNodeMap.set(node.id, node);
+    idToAddressMap.set(node.id, node.addr);
+    gravitySum += node.gravity;
     if (!Array.isArray(node.pos) || node.pos.length < 3) {
       return;
     }
@@ -263,6 +250,7 @@ function updatePositionScale(nodes) {
     maxY = Math.max(maxY, y);
     maxZ = Math.max(maxZ, z);
   });
+  const avgGravity = gravitySum / nodes.length;
 
   const spanX = maxX - minX;
   const spanY = maxY - minY;
@@ -271,7 +259,7 @@ function updatePositionScale(nodes) {
 
   if (!Number.isFinite(largestSpan) || largestSpan <= 0) {
     currentPositionScale = MAX_POSITION_SCALE;
-    return;
+    return avgGravity;
   }
 
   const desiredScale = TARGET_SCENE_SPAN / largestSpan;
@@ -279,6 +267,7 @@ function updatePositionScale(nodes) {
     MAX_POSITION_SCALE,
     Math.max(1, desiredScale)
   );
+  return avgGravity;
 }
 
 function hashString(input = "") {
@@ -302,17 +291,30 @@ function adjustColorForNodeType(color, nodeType) {
   return color;
 }
 
+const orphanNodeColor = new THREE.Color(orphanColor);
+// Node colors depend only on (node type, data type); each pair is resolved
+// and lightness-adjusted once, then shared. Callers copy, never mutate, them.
+const nodeColorCache = new Map();
+
 function getColorForNode(node) {
   const neighborCount = Array.isArray(node.neighbors) ? node.neighbors.length : 0;
   if (neighborCount === 0) {
-    return new THREE.Color(orphanColor);
+    return orphanNodeColor;
+  }
+  const cacheKey = `${node.type}\u0000${node.data_type}`;
+  let color = nodeColorCache.get(cacheKey);
+  if (!color) {
+    const typeKey = (node.data_type ?? "").toLowerCase();
+    const isNonePayload = !node.data_type || typeKey === "nonetype" || typeKey === "none";
+    const dataColorHex = isNonePayload ? noneTypeColor : dataTypeColors[typeKey];
+    const fallbackHex = palette[node.type] ?? palette.default;
+    color = adjustColorForNodeType(
+      new THREE.Color(dataColorHex ?? fallbackHex),
+      node.type ?? "default"
+    );
+    nodeColorCache.set(cacheKey, color);
   }
-  const typeKey = (node.data_type ?? "").toLowerCase();
-  const isNonePayload = !node.data_type || typeKey === "nonetype" || typeKey === "none";
-  const dataColorHex = isNonePayload ? noneTypeColor : dataTypeColors[typeKey];
-  const fallbackHex = palette[node.type] ?? palette.default;
-  const color = new THREE.Color(dataColorHex ?? fallbackHex);
-  return adjustColorForNodeType(color, node.type ?? "default");
+  return color;
 }
 
 function computeNeighborScale(node) {
@@ -387,44 +389,143 @@ function pruneNodes() {
   }
 }
 
-function rebuildEdges(nodes) {
-  const nodeMap = new Map(nodes.map((node) => [node.id, node]));
+// Connector and dot meshes are kept across rebuilds; each frame rewrites
+// their instance matrices and they are only reallocated to grow
+let edgeInstances = null;
+let dotInstances = null;
 
-  while (edgesGroup.children.length) {
-    edgesGroup.remove(edgesGroup.children[0]);
+function reserveInstances(mesh, geometry, material, count) {
+  if (mesh && mesh.instanceMatrix.count >= count) {
+    mesh.count = count;
+    return mesh;
+  }
+  if (mesh) {
+    edgesGroup.remove(mesh);
+    mesh.dispose();
   }
+  let capacity = 64;
+  while (capacity < count) {
+    capacity *= 2;
+  }
+  const grown = new THREE.InstancedMesh(geometry, material, capacity);
+  grown.count = count;
+  edgesGroup.add(grown);
+  return grown;
+}
+
+function commitInstances(mesh) {
+  mesh.instanceMatrix.needsUpdate = true;
+  mesh.computeBoundingSphere();
+}
+
+// Returns how many edges were left undrawn (all of them above MAX_DRAWN_EDGES)
+function rebuildEdges(nodes) {
+  const nodeMap = idToNodeMap;
 
+  const pairs = [];
+  const seen = new Set();
   nodes.forEach((node) => {
     (node.neighbors || []).forEach((neighborId) => {
       const neighbor = nodeMap.get(neighborId);
-      if (!neighbor || neighbor.id < node.id) {
-        return; // avoid duplicate lines
-      }
-      const start = getScaledPositionVector(node.pos);
-      const end = getScaledPositionVector(neighbor.pos);
-      const edgeMesh = createEdgeMesh(start, end);
-      if (edgeMesh) {
-        edgesGroup.add(edgeMesh);
+      if (!neighbor) {
+        return;
       }
-      const dots = createEdgeDots(start, end);
-      if (dots) {
-        edgesGroup.add(dots);
+      // Draw each undirected edge once, even when only one side lists it
+      const key =
+        node.id < neighbor.id ? `${node.id}:${neighbor.id}` : `${neighbor.id}:${node.id}`;
+      if (seen.has(key)) {
+        return;
       }
+      seen.add(key);
+      pairs.push([node, neighbor]);
     });
   });
+
+  // A graph this dense draws as a solid mass; hide edges and report the count
+  if (pairs.length > MAX_DRAWN_EDGES) {
+    if (edgeInstances) {
+      edgeInstances.count = 0;
+    }
+    if (dotInstances) {
+      dotInstances.count = 0;
+    }
+    return pairs.length;
+  }
+
+  // Every connector and every dot is an instance of one mesh, so the whole
+  // edge set is two draw calls however many edges there are
+  const segments = [];
+  let dotCount = 0;
+  pairs.forEach(([node, neighbor]) => {
+    const start = getScaledPositionVector(node.pos);
+    const end = getScaledPositionVector(neighbor.pos);
+    const length = start.distanceTo(end);
+    if (!length) {
+      return;
+    }
+    const steps = Math.max(2, Math.ceil(length / 1.25));
+    segments.push({ start, end, length, steps });
+    dotCount += steps + 1;
+  });
+  const drawDots = dotCount <= MAX_CONNECTOR_DOTS;
+  const edgeMesh = (edgeInstances = reserveInstances(
+    edgeInstances,
+    baseEdgeGeometry,
+    baseEdgeMaterial,
+    segments.length
+  ));
+  const dotMesh = (dotInstances = reserveInstances(
+    dotInstances,
+    baseDotGeometry,
+    baseDotMaterial,
+    drawDots ? dotCount : 0
+  ));
+  edgeScale.set(connectorThicknessScale, 1, connectorThicknessScale);
+  let dotIndex = 0;
+  segments.forEach(({ start, end, length, steps }, index) => {
+    edgeMidpoint.addVectors(start, end).multiplyScalar(0.5);
+    edgeDirection.subVectors(end, start).divideScalar(length);
+    edgeQuaternion.setFromUnitVectors(upAxis, edgeDirection);
+    edgeScale.y = length;
+    edgeMesh.setMatrixAt(index, edgeMatrix.compose(edgeMidpoint, edgeQuaternion, edgeScale));
+    if (!drawDots) {
+      return;
+    }
+
+    for (let i = 0; i <= steps; i += 1) {
+      dotPosition.copy(start).lerp(end, i / steps);
+      edgeMatrix
+        .makeScale(connectorThicknessScale, connectorThicknessScale, connectorThicknessScale)
+        .setPosition(dotPosition);
+      dotMesh.setMatrixAt(dotIndex, edgeMatrix);
+      dotIndex += 1;
+    }
+  });
+  commitInstances(edgeMesh);
+  commitInstances(dotMesh);
+  return 0;
 }
 
-function updateStats(nodes) {
-  const nodeCountEl = document.getElementById("node-count");
-  const avgGravityEl = document.getElementById("avg-gravity");
-  const statusEl = document.getElementById("status");
+const nodeCountEl = document.getElementById("node-count");
+const avgGravityEl = document.getElementById("avg-gravity");
+const statsStatusEl = document.getElementById("status");
 
-  nodeCountEl.textContent = nodes.length.toString();
-  const avgGravity = nodes.length
-    ? nodes.reduce((sum, node) => sum + node.gravity, 0) / nodes.length
-    : 0;
-  avgGravityEl.textContent = avgGravity.toFixed(3);
-  statusEl.textContent = `Live (nodes: ${nodes.length})`;
+// Writing identical text still invalidates layout, so unchanged stats are skipped
+function setText(element, text) {
+  if (element.textContent !== text) {
+    element.textContent = text;
+  }
+}
+
+function updateStats(nodes, avgGravity, hiddenEdges = 0) {
+  setText(nodeCountEl, nodes.length.toString());
+  setText(avgGravityEl, avgGravity.toFixed(3));
+  setText(
+    statsStatusEl,
+    hiddenEdges
+      ? `Live (nodes: ${nodes.length}, ${hiddenEdges} edges not drawn)`
+      : `Live (nodes: ${nodes.length})`
+  );
 }
 
 function escapeHtml(value = "") {
@@ -502,12 +603,12 @@ function renderNodeTable(nodes) {
   }
 
   if (!nodes.length) {
-    tableBody.innerHTML = '<tr><td colspan="15">No nodes</td></tr>';
+    setTableHtml('<tr><td colspan="15">No nodes</td></tr>');
     return;
   }
 
   const rows = nodes
-    .slice(0, 50)
+    .slice(0, MAX_TABLE_ROWS)
     .map((node) => {
       const addr = truncate(node.addr ?? "", 14);
       const { full: dataFull, short: dataShort } = formatDataSerialized(node);
@@ -547,7 +648,21 @@ function renderNodeTable(nodes) {
     })
     .join("");
 
-  tableBody.innerHTML = rows;
+  const hiddenRows = nodes.length - MAX_TABLE_ROWS;
+  const footer =
+    hiddenRows > 0
+      ? `<tr><td colspan="15">Showing ${MAX_TABLE_ROWS} of ${nodes.length} nodes</td></tr>`
+      : "";
+  setTableHtml(rows + footer);
+}
+
+function setTableHtml(html) {
+  // Reparsing and laying out the table costs far more than building the
+  // string, so the DOM is only touched when a visible row changed
+  if (html !== renderedTableHtml) {
+    tableBody.innerHTML = html;
+    renderedTableHtml = html;
+  }
 }
 
 function activateNodeFromSnapshot(nodeId) {
@@ -807,21 +922,39 @@ function handleCanvasClick(event) {
   focusCameraOnNode(node.id);
 }
 
+// Set window.__lunarProfile = true in the console to record per-section
+// frame timings (milliseconds) into window.__lunarTimings
+function timed(timings, name, fn) {
+  if (!timings) {
+    return fn();
+  }
+  const start = performance.now();
+  const result = fn();
+  timings[name] = performance.now() - start;
+  return result;
+}
+
 function applyPayload(payload) {
   const nodes = payload.nodes ?? [];
   cachedNodes = nodes;
-  idToNodeMap = new Map(nodes.map((node) => [node.id, node]));
-  idToAddressMap = new Map(nodes.map((node) => [node.id, node.addr]));
   window.__lunarLastPayload = payload; // exposed for debugging
   console.debug("Visualizer payload", { count: nodes.length, sample: nodes[0] });
-  updatePositionScale(nodes);
-  nodes.forEach(upsertNodeMesh);
-  pruneNodes();
-  rebuildEdges(nodes);
-  updateStats(nodes);
-  renderNodeTable(nodes);
+  const timings = window.__lunarProfile ? {} : null;
+  // rebuildEdges and the table reuse the lookups indexNodes fills
+  const avgGravity = timed(timings, "index", () => indexNodes(nodes));
+  timed(timings, "meshes", () => {
+    nodes.forEach(upsertNodeMesh);
+    pruneNodes();
+  });
+  const hiddenEdges = timed(timings, "edges", () => rebuildEdges(nodes));
+  timed(timings, "stats", () => updateStats(nodes, avgGravity, hiddenEdges));
+  timed(timings, "table", () => renderNodeTable(nodes));
   refreshHistoryHeader();
   updateSelectionHighlight();
+  if (timings) {
+    window.__lunarTimings = timings;
+    console.debug("Visualizer frame timings (ms)", timings);
+  }
 }
 
 function handlePayload(payload) {
@@ -919,8 +1052,24 @@ window.addEventListener("resize", () => {
   renderer.setSize(window.innerWidth, window.innerHeight);
 });
 
-renderer.domElement.addEventListener("pointermove", handleHover);
+// Pointers can report moves faster than the display refreshes; raycast at
+// most once per frame, against the latest position
+let pendingHoverEvent = null;
+let hoverFrame = 0;
+renderer.domElement.addEventListener("pointermove", (event) => {
+  pendingHoverEvent = event;
+  if (!hoverFrame) {
+    hoverFrame = requestAnimationFrame(() => {
+      hoverFrame = 0;
+      handleHover(pendingHoverEvent);
+    });
+  }
+});
 renderer.domElement.addEventListener("pointerleave", () => {
+  if (hoverFrame) {
+    cancelAnimationFrame(hoverFrame);
+    hoverFrame = 0;
+  }
   pointerDownSnapshot = null;
   hideTooltip();
 });
@@ -1312,10 +1461,13 @@ motionSpeedSlider?.addEventListener("input", (event) => {
 
 setPauseState(false);
 
+const payloadDecoder = new TextDecoder();
+
 function connectWebSocket() {
   const statusEl = document.getElementById("status");
   const protocol = window.location.protocol === "https:" ? "wss" : "ws";
   const socket = new WebSocket(`${protocol}://${window.location.host}/ws/nodes`);
+  socket.binaryType = "arraybuffer";
 
   socket.addEventListener("open", () => {
     statusEl.textContent = "Connected";
@@ -1323,7 +1475,9 @@ function connectWebSocket() {
 
   socket.addEventListener("message", event => {
     try {
-      const payload = JSON.parse(event.data);
+      const text =
+        typeof event.data === "string" ? event.data : payloadDecoder.decode(event.data);
+      const payload = JSON.parse(text);
       handlePayload(payload);
     } catch (error) {
       console.error("Malformed payload", error);